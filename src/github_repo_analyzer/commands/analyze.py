@@ -3,11 +3,15 @@
 from typing import Optional
 
 import click
-from rich.console import Console
 
 from github_repo_analyzer.config import create_config
 from github_repo_analyzer.core import GitHubAPI, RepositoryService
-from github_repo_analyzer.formatters import display_json, display_summary, display_table
+from github_repo_analyzer.formatters import (
+    console,
+    display_json,
+    display_summary,
+    display_table,
+)
 from github_repo_analyzer.loggers import get_logger
 from github_repo_analyzer.utils import clamp_limit
 from github_repo_analyzer.validation import (
@@ -17,7 +21,6 @@ from github_repo_analyzer.validation import (
 )
 
 logger = get_logger(__name__)
-console = Console()
 
 
 @click.command()
@@ -90,9 +93,9 @@ def analyze(
 
         # Create configuration
         config = create_config(
-            token=config_inputs.get("token"),
-            cache_dir=config_inputs["cache_dir"],
-            cache_ttl=config_inputs["cache_ttl"],
+            token=config_inputs.token,
+            cache_dir=config_inputs.cache_dir,
+            cache_ttl=config_inputs.cache_ttl,
             no_cache=no_cache,
         )
 
@@ -116,22 +119,22 @@ def analyze(
         logger.info(
             "Fetching repositories for %s: %s",
             "organization" if org else "user",
-            analyze_inputs["username_or_org"],
+            analyze_inputs.username_or_org,
         )
 
         # Clamp limit to valid range using config
         limit_val = clamp_limit(
-            analyze_inputs["limit"],
+            analyze_inputs.limit,
             config.limits.default_limit,
             config.limits.max_limit,
         )
 
         # Analyze repositories using service
         stats = service.analyze_repositories(
-            analyze_inputs["username_or_org"],
+            analyze_inputs.username_or_org,
             is_organization=org,
             limit=limit_val,
-            sort_field=analyze_inputs["sort_field"],
+            sort_field=analyze_inputs.sort_field,
         )
 
         if not stats:
@@ -140,30 +143,31 @@ def analyze(
 
         repos = stats["repositories"]
 
-        if analyze_inputs["limit"]:
-            repos = repos[: analyze_inputs["limit"]]
+        if analyze_inputs.limit:
+            repos = repos[: analyze_inputs.limit]
 
-        if analyze_inputs["output_format"] == "summary":
-            display_summary(stats, analyze_inputs["username_or_org"], org)
-        elif analyze_inputs["output_format"] == "json":
+        if analyze_inputs.output_format == "summary":
+            display_summary(stats, analyze_inputs.username_or_org, org)
+        elif analyze_inputs.output_format == "json":
             display_json(repos)
         else:
-            display_table(repos, analyze_inputs["username_or_org"], org)
+            display_table(repos, analyze_inputs.username_or_org, org)
 
     except (ValueError, ValidationError) as e:
         error_msg = str(e)
-        if "token" in error_msg.lower():
-            console.print(f"[red]Authentication Error: {error_msg}[/red]")
-            console.print(
-                "[yellow]Tip: Set GITHUB_TOKEN environment variable or use "
-                "--token option[/yellow]"
-            )
-        elif "rate limit" in error_msg.lower():
+        # The rate limit message mentions tokens, so check it first
+        if "rate limit" in error_msg.lower():
             console.print(f"[red]Rate Limit Error: {error_msg}[/red]")
             console.print(
                 "[yellow]Tip: Wait a few minutes before trying again, or use a "
                 "personal access token for higher limits[/yellow]"
             )
+        elif "token" in error_msg.lower():
+            console.print(f"[red]Authentication Error: {error_msg}[/red]")
+            console.print(
+                "[yellow]Tip: Set GITHUB_TOKEN environment variable or use "
+                "--token option[/yellow]"
+            )
         elif "not found" in error_msg.lower():
             console.print(f"[red]Not Found Error: {error_msg}[/red]")
             console.print(
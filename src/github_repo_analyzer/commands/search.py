@@ -3,11 +3,10 @@
 from typing import Optional
 
 import click
-from rich.console import Console
 
 from github_repo_analyzer.config import create_config
 from github_repo_analyzer.core import GitHubAPI, RepositoryService
-from github_repo_analyzer.formatters import display_table
+from github_repo_analyzer.formatters import console, display_table
 from github_repo_analyzer.loggers import get_logger
 from github_repo_analyzer.utils import clamp_limit
 from github_repo_analyzer.validation import (
@@ -17,7 +16,6 @@ from github_repo_analyzer.validation import (
 )
 
 logger = get_logger(__name__)
-console = Console()
 
 
 @click.command()
@@ -96,9 +94,9 @@ def search(
 
         # Create configuration
         config = create_config(
-            token=config_inputs.get("token"),
-            cache_dir=config_inputs["cache_dir"],
-            cache_ttl=config_inputs["cache_ttl"],
+            token=config_inputs.token,
+            cache_dir=config_inputs.cache_dir,
+            cache_ttl=config_inputs.cache_ttl,
             no_cache=no_cache,
         )
 
@@ -126,25 +124,25 @@ def search(
         logger.info(
             "Searching repositories for %s: %s",
             "organization" if org else "user",
-            search_inputs["username_or_org"],
+            search_inputs.username_or_org,
         )
 
         # Clamp limit to valid range using config
         limit_val = clamp_limit(
-            search_inputs["limit"], config.limits.default_limit, config.limits.max_limit
+            search_inputs.limit, config.limits.default_limit, config.limits.max_limit
         )
 
         # Search repositories using service
         filtered_repos = service.search_repositories(
-            search_inputs["username_or_org"],
+            search_inputs.username_or_org,
             is_organization=org,
-            language=search_inputs["language"],
-            min_stars=search_inputs["min_stars"],
-            min_forks=search_inputs["min_forks"],
-            public_only=search_inputs["public_only"],
-            private_only=search_inputs["private_only"],
+            language=search_inputs.language,
+            min_stars=search_inputs.min_stars,
+            min_forks=search_inputs.min_forks,
+            public_only=search_inputs.public_only,
+            private_only=search_inputs.private_only,
             limit=limit_val,
-            sort_field=search_inputs["sort_field"],
+            sort_field=search_inputs.sort_field,
         )
 
         if not filtered_repos:
@@ -152,22 +150,23 @@ def search(
             return
 
         logger.info("Found %d repositories matching criteria", len(filtered_repos))
-        display_table(filtered_repos, search_inputs["username_or_org"], org)
+        display_table(filtered_repos, search_inputs.username_or_org, org)
 
     except (ValueError, ValidationError) as e:
         error_msg = str(e)
-        if "token" in error_msg.lower():
-            console.print(f"[red]Authentication Error: {error_msg}[/red]")
-            console.print(
-                "[yellow]Tip: Set GITHUB_TOKEN environment variable or use "
-                "--token option[/yellow]"
-            )
-        elif "rate limit" in error_msg.lower():
+        # The rate limit message mentions tokens, so check it first
+        if "rate limit" in error_msg.lower():
             console.print(f"[red]Rate Limit Error: {error_msg}[/red]")
             console.print(
                 "[yellow]Tip: Wait a few minutes before trying again, or use a "
                 "personal access token for higher limits[/yellow]"
             )
+        elif "token" in error_msg.lower():
+            console.print(f"[red]Authentication Error: {error_msg}[/red]")
+            console.print(
+                "[yellow]Tip: Set GITHUB_TOKEN environment variable or use "
+                "--token option[/yellow]"
+            )
         elif "not found" in error_msg.lower():
             console.print(f"[red]Not Found Error: {error_msg}[/red]")
             console.print(
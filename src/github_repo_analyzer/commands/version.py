@@ -1,7 +1,6 @@
 """Version command for GitHub Repository Analyzer."""
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 
 from github_repo_analyzer import (
@@ -11,8 +10,7 @@ from github_repo_analyzer import (
     __repository__,
     __version__,
 )
-
-console = Console()
+from github_repo_analyzer.formatters import console
 
 
 @click.command()
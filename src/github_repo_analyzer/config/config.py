@@ -1,7 +1,7 @@
 """Configuration management for GitHub Repository Analyzer."""
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True)
 class CacheConfig:
     """Cache configuration settings."""
 
@@ -19,7 +19,7 @@ class CacheConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class APIConfig:
     """GitHub API configuration settings."""
 
@@ -29,7 +29,7 @@ class APIConfig:
     rate_limit_buffer: int = 10  # Buffer before hitting rate limit
 
 
-@dataclass
+@dataclass(frozen=True)
 class LimitConfig:
     """Repository limit configuration settings."""
 
@@ -38,7 +38,7 @@ class LimitConfig:
     unlimited_value: int = -1  # Value that means "unlimited"
 
 
-@dataclass
+@dataclass(frozen=True)
 class OutputConfig:
     """Output formatting configuration settings."""
 
@@ -48,7 +48,7 @@ class OutputConfig:
     summary_languages_count: int = 5
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration settings."""
 
@@ -59,7 +59,7 @@ class LoggingConfig:
     max_log_files: int = 7  # Keep 7 days of log files
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Main configuration class for GitHub Repository Analyzer."""
 
@@ -76,7 +76,7 @@ class Config:
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
+        """Validate configuration once; instances are immutable afterwards."""
         self._validate()
 
     def _validate(self) -> None:
@@ -101,39 +101,17 @@ class Config:
 
     def with_cache_disabled(self) -> "Config":
         """Return a copy of config with caching disabled."""
-        config = Config(
-            github_token=self.github_token,
-            cache=CacheConfig(enabled=False),
-            api=self.api,
-            limits=self.limits,
-            output=self.output,
-            logging=self.logging,
-        )
-        return config
+        return replace(self, cache=CacheConfig(enabled=False))
 
     def with_custom_cache(self, directory: str, ttl_seconds: int) -> "Config":
         """Return a copy of config with custom cache settings."""
-        config = Config(
-            github_token=self.github_token,
-            cache=CacheConfig(directory=directory, ttl_seconds=ttl_seconds),
-            api=self.api,
-            limits=self.limits,
-            output=self.output,
-            logging=self.logging,
+        return replace(
+            self, cache=CacheConfig(directory=directory, ttl_seconds=ttl_seconds)
         )
-        return config
 
     def with_custom_token(self, token: str) -> "Config":
         """Return a copy of config with custom token."""
-        config = Config(
-            github_token=token,
-            cache=self.cache,
-            api=self.api,
-            limits=self.limits,
-            output=self.output,
-            logging=self.logging,
-        )
-        return config
+        return replace(self, github_token=token)
 
 
 # Global configuration instance (lazy initialization)
@@ -173,33 +151,26 @@ def create_config(
     """
     # Start with global config
     global_config = get_config()
-    custom_config = Config(
-        github_token=token or global_config.github_token,
-        cache=global_config.cache,
-        api=global_config.api,
-        limits=global_config.limits,
-        output=global_config.output,
-        logging=global_config.logging,
-    )
 
     # Apply custom settings
+    cache = global_config.cache
     if cache_dir is not None or cache_ttl is not None or no_cache:
-        cache_config = CacheConfig(
+        cache = CacheConfig(
             directory=cache_dir or global_config.cache.directory,
             ttl_seconds=(
                 cache_ttl if cache_ttl is not None else global_config.cache.ttl_seconds
             ),
             enabled=not no_cache,
         )
-        custom_config.cache = cache_config
 
+    api = global_config.api
     if timeout is not None:
-        api_config = APIConfig(
-            timeout_seconds=timeout,
-            max_retries=global_config.api.max_retries,
-            retry_delay_seconds=global_config.api.retry_delay_seconds,
-            rate_limit_buffer=global_config.api.rate_limit_buffer,
-        )
-        custom_config.api = api_config
+        api = replace(global_config.api, timeout_seconds=timeout)
 
-    return custom_config
+    # Build the copy in one step so the combined settings are validated once
+    return replace(
+        global_config,
+        github_token=token or global_config.github_token,
+        cache=cache,
+        api=api,
+    )
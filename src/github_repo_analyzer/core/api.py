@@ -1,12 +1,16 @@
 """GitHub API client for repository analysis."""
 
+import heapq
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from github import Auth, Github
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException
 
 from github_repo_analyzer.core.models import Repository
 from github_repo_analyzer.loggers import (
@@ -17,10 +21,43 @@ from github_repo_analyzer.loggers import (
 
 logger = get_logger(__name__)
 
+# Maximum number of repository listings kept in the in-process cache
+REPO_CACHE_MAXSIZE = 128
+
+# Largest page size the GitHub REST API accepts
+MAX_PAGE_SIZE = 100
+
+# (username_or_org, is_organization, limit), plus (query, sort) for searches
+RepoCacheKey = Tuple[Any, ...]
+
+# Shown for primary rate limits, whether reported as 403, 429 or exhausted retries
+_MSG_RATE_LIMITED = (
+    "GitHub API rate limit exceeded. Please wait before trying again. "
+    "Consider using a personal access token for higher limits."
+)
+
 
 # Removed the helper functions - now using Repository.from_pygithub() for DRY approach
 
 
+def _is_rate_limited(e: GithubException) -> bool:
+    """Return whether a 403 response is a rate limit rather than a permission error."""
+    return isinstance(e, RateLimitExceededException) or "rate limit" in str(e).lower()
+
+
+def _is_unsearchable_account(e: GithubException) -> bool:
+    """Return whether a 422 search error rejects the user:/org: qualifier.
+
+    GitHub also answers malformed or over-long queries with a 422, so only the
+    error it gives for accounts that do not exist (or cannot be viewed) counts.
+    """
+    errors = e.data.get("errors") if isinstance(e.data, dict) else None
+    return any(
+        isinstance(error, dict) and "cannot be searched" in error.get("message", "")
+        for error in errors or []
+    )
+
+
 class GitHubAPI:
     """GitHub API client using PyGithub."""
 
@@ -30,16 +67,21 @@ class GitHubAPI:
         cache_dir: Optional[str] = ".cache",
         cache_ttl: int = 3600,
         timeout: int = 30,
+        verify_auth: bool = False,
     ):
         """Initialize GitHub API client.
 
+        No request is made unless verify_auth is set; authentication errors
+        otherwise surface from the first API call.
+
         Args:
             token: GitHub personal access token. If not provided, will try to get
                 from GITHUB_TOKEN env var.
-            cache_dir: Directory to store cache files (PyGithub handles caching
-                internally)
-            cache_ttl: Cache time-to-live in seconds (PyGithub handles this internally)
+            cache_dir: Directory to store cache files. Passing None disables
+                caching, including the in-process repository listing cache.
+            cache_ttl: Cache time-to-live in seconds for repository listings
             timeout: Request timeout in seconds
+            verify_auth: Eagerly verify the token with a request to /user
         """
         logger.debug("Initializing GitHub API client")
 
@@ -52,22 +94,46 @@ class GitHubAPI:
             )
 
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache_enabled = cache_dir is not None and cache_ttl > 0
+        self._repo_cache: Dict[RepoCacheKey, Tuple[float, List[Repository]]] = {}
+        self._repo_cache_lock = threading.Lock()
         logger.debug("Using token: %s...", self.token[:8])
         logger.debug(
             "Cache directory: %s, TTL: %ds, Timeout: %ds", cache_dir, cache_ttl, timeout
         )
 
         try:
-            logger.debug("Connecting to GitHub API")
             # PyGithub handles authentication, caching, and rate limiting automatically
-            self.github = Github(auth=Auth.Token(self.token), timeout=timeout)
-            # Test the connection
-            user = self.github.get_user()
-            logger.info("Connected to GitHub API as user: %s", user.login)
+            # The client is shared across threads, so the page size is fixed
+            # here (at GitHub's maximum) rather than changed per request
+            self.github = Github(
+                auth=Auth.Token(self.token), timeout=timeout, per_page=MAX_PAGE_SIZE
+            )
+        except Exception as e:
+            raise ValueError(f"Unexpected error connecting to GitHub: {e}")
+
+        if verify_auth:
+            self.verify_auth()
+
+    def verify_auth(self) -> str:
+        """Verify the token by fetching the authenticated user.
+
+        Returns:
+            Login of the authenticated user
+
+        Raises:
+            ValueError: If the connection or authentication fails
+        """
+        try:
+            logger.debug("Connecting to GitHub API")
+            login: str = self.github.get_user().login
+            logger.info("Connected to GitHub API as user: %s", login)
+            return login
         except requests.exceptions.Timeout:
-            logger.error("GitHub API connection timeout after %ds", timeout)
+            logger.error("GitHub API connection timeout after %ds", self.timeout)
             raise ValueError(
-                f"Connection to GitHub API timed out after {timeout} seconds"
+                f"Connection to GitHub API timed out after {self.timeout} seconds"
             )
         except requests.exceptions.ConnectionError:
             logger.error("GitHub API connection failed")
@@ -80,6 +146,8 @@ class GitHubAPI:
                 raise ValueError(
                     "Invalid GitHub token. Please check your token and try again."
                 )
+            elif e.status == 403 and _is_rate_limited(e):
+                raise ValueError(_MSG_RATE_LIMITED)
             elif e.status == 403:
                 raise ValueError(
                     "GitHub API access forbidden. Your token may lack required "
@@ -87,6 +155,9 @@ class GitHubAPI:
                 )
             else:
                 raise ValueError(f"GitHub API error: {e}")
+        except requests.exceptions.RetryError as e:
+            self._handle_retry_error(e, "connecting to GitHub")
+            return ""  # This line will never be reached, but satisfies mypy
         except Exception as e:
             raise ValueError(f"Unexpected error connecting to GitHub: {e}")
 
@@ -102,11 +173,8 @@ class GitHubAPI:
                 "Invalid GitHub token. Please check your token and try again."
             )
         elif e.status == 403:
-            if "rate limit" in str(e).lower():
-                raise ValueError(
-                    "GitHub API rate limit exceeded. Please wait before trying again. "
-                    "Consider using a personal access token for higher limits."
-                )
+            if _is_rate_limited(e):
+                raise ValueError(_MSG_RATE_LIMITED)
             else:
                 raise ValueError(
                     "GitHub API access forbidden. Your token may lack required "
@@ -120,13 +188,28 @@ class GitHubAPI:
         elif e.status == 422:
             raise ValueError(f"Invalid request: {e}")
         elif e.status == 429:
-            raise ValueError(
-                "GitHub API rate limit exceeded. Please wait before trying again. "
-                "Consider using a personal access token for higher limits."
-            )
+            raise ValueError(_MSG_RATE_LIMITED)
         else:
             raise ValueError(f"GitHub API error during {operation}: {e}")
 
+    def _handle_retry_error(
+        self, e: requests.exceptions.RetryError, operation: str
+    ) -> None:
+        """Handle requests that PyGithub gave up retrying.
+
+        PyGithub retries rate-limited 403 responses and server errors itself;
+        once its retries are exhausted requests raises a RetryError instead of
+        a GithubException.
+
+        Args:
+            e: The retry error
+            operation: Description of the operation that failed
+        """
+        logger.error("GitHub API retries exhausted while %s: %s", operation, e)
+        if "too many 403 error responses" in str(e):
+            raise ValueError(_MSG_RATE_LIMITED)
+        raise ValueError(f"GitHub API kept failing while {operation}. Try again later.")
+
     def _retry_on_rate_limit(self, func: Any, *args: Any, **kwargs: Any) -> Any:
         """Retry a function call if rate limited.
 
@@ -156,6 +239,59 @@ class GitHubAPI:
             except Exception:
                 raise
 
+    def _get_cached_repos(self, key: RepoCacheKey) -> Optional[List[Repository]]:
+        """Return a cached repository listing if present and not expired.
+
+        Args:
+            key: Cache key starting with (username_or_org, is_organization, limit)
+
+        Returns:
+            Copy of the cached repository list, or None on a cache miss
+        """
+        if not self._cache_enabled:
+            return None
+
+        with self._repo_cache_lock:
+            entry = self._repo_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, repos = entry
+            if time.monotonic() >= expires_at:
+                del self._repo_cache[key]
+                return None
+            return list(repos)
+
+    def _set_cached_repos(self, key: RepoCacheKey, repos: List[Repository]) -> None:
+        """Store a repository listing in the in-process cache.
+
+        Args:
+            key: Cache key starting with (username_or_org, is_organization, limit)
+            repos: Repository list to cache
+        """
+        if not self._cache_enabled:
+            return
+
+        with self._repo_cache_lock:
+            self._repo_cache.pop(key, None)
+            if len(self._repo_cache) >= REPO_CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._repo_cache[next(iter(self._repo_cache))]
+            self._repo_cache[key] = (time.monotonic() + self.cache_ttl, list(repos))
+
+    def invalidate(self, username_or_org: Optional[str] = None) -> None:
+        """Drop cached repository listings.
+
+        Args:
+            username_or_org: Only drop listings for this user or organization.
+                Drops everything if None.
+        """
+        with self._repo_cache_lock:
+            if username_or_org is None:
+                self._repo_cache.clear()
+                return
+            for key in [k for k in self._repo_cache if k[0] == username_or_org]:
+                del self._repo_cache[key]
+
     def get_user_repos(
         self, username: str, per_page: int = 100, page: int = 1
     ) -> List[Repository]:
@@ -176,7 +312,7 @@ class GitHubAPI:
             raise ValueError("Username cannot be empty")
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             def _get_repos() -> List[Any]:
                 logger.debug("Making API call to get user: %s", username)
@@ -187,7 +323,7 @@ class GitHubAPI:
 
             all_repos = self._retry_on_rate_limit(_get_repos)
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             log_performance(logger, f"fetch user {username} repositories", duration)
 
             # Manual pagination since PyGithub doesn't support per_page/page directly
@@ -218,6 +354,9 @@ class GitHubAPI:
                 e, f"fetching repositories for user {username}"
             )
             return []  # This line will never be reached, but satisfies mypy
+        except requests.exceptions.RetryError as e:
+            self._handle_retry_error(e, f"fetching repositories for user {username}")
+            return []  # This line will never be reached, but satisfies mypy
         except requests.exceptions.Timeout:
             logger.error("Request timeout while fetching repositories for %s", username)
             raise ValueError(
@@ -274,6 +413,11 @@ class GitHubAPI:
                 e, f"fetching repositories for organization {org_name}"
             )
             return []  # This line will never be reached, but satisfies mypy
+        except requests.exceptions.RetryError as e:
+            self._handle_retry_error(
+                e, f"fetching repositories for organization {org_name}"
+            )
+            return []  # This line will never be reached, but satisfies mypy
         except requests.exceptions.Timeout:
             raise ValueError(
                 f"Request timed out while fetching repositories for organization "
@@ -305,6 +449,14 @@ class GitHubAPI:
         Returns:
             List of Repository objects (up to limit)
         """
+        # islice rejects negative limits; treat them as "no repositories"
+        limit = max(limit, 0)
+        cache_key = (username_or_org, is_organization, limit)
+        cached = self._get_cached_repos(cache_key)
+        if cached is not None:
+            logger.debug("Using cached repositories for %s", username_or_org)
+            return cached
+
         try:
             if is_organization:
                 org = self.github.get_organization(username_or_org)
@@ -313,14 +465,13 @@ class GitHubAPI:
                 user = self.github.get_user(username_or_org)
                 repos = user.get_repos(sort="updated", direction="desc")
 
-            # Fetch repositories with limit to prevent hanging
-            repo_list = []
-            for i, repo in enumerate(repos):
-                if i >= limit:
-                    break
-                repo_list.append(Repository.from_pygithub(repo))
+            # Stop iterating at the limit so no further pages are requested
+            repo_list = [
+                Repository.from_pygithub(repo) for repo in islice(repos, limit)
+            ]
 
             logger.info(f"Fetched {len(repo_list)} repositories for {username_or_org}")
+            self._set_cached_repos(cache_key, repo_list)
             return repo_list
         except GithubException as e:
             logger.error("Error fetching repositories for %s: %s", username_or_org, e)
@@ -328,6 +479,9 @@ class GitHubAPI:
                 e, f"fetching repositories for {username_or_org}"
             )
             return []  # This line will never be reached, but satisfies mypy
+        except requests.exceptions.RetryError as e:
+            self._handle_retry_error(e, f"fetching repositories for {username_or_org}")
+            return []  # This line will never be reached, but satisfies mypy
         except requests.exceptions.Timeout:
             raise ValueError(
                 f"Request timed out while fetching repositories for {username_or_org}"
@@ -343,6 +497,111 @@ class GitHubAPI:
             )
             raise ValueError(f"Unexpected error fetching repositories: {e}")
 
+    def search_repos(
+        self,
+        username_or_org: str,
+        is_organization: bool = False,
+        language: Optional[str] = None,
+        min_stars: Optional[int] = None,
+        min_forks: Optional[int] = None,
+        sort: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Repository]:
+        """Search repositories using the GitHub Search API.
+
+        Language and star/fork thresholds are evaluated server-side, so only
+        matching repositories are transferred. Search results are not a full
+        listing: forks are only indexed when they have more stars than their
+        parent, recently pushed repositories can be missing from the index, at
+        most 1000 results are returned, and searches have a much lower rate
+        limit (30 requests per minute).
+
+        Args:
+            username_or_org: GitHub username or organization name
+            is_organization: Whether the target is an organization
+            language: Filter by programming language
+            min_stars: Minimum number of stars
+            min_forks: Minimum number of forks
+            sort: Search sort field (stars, forks, updated); best match if None
+            limit: Maximum number of repositories to fetch (default: 100)
+
+        Returns:
+            List of Repository objects (up to limit)
+        """
+        qualifiers = [
+            f"{'org' if is_organization else 'user'}:{username_or_org}",
+            "fork:true",
+        ]
+        if language:
+            qualifiers.append(
+                f'language:"{language}"' if " " in language else f"language:{language}"
+            )
+        # Zero thresholds match every repository
+        if min_stars:
+            qualifiers.append(f"stars:>={min_stars}")
+        if min_forks:
+            qualifiers.append(f"forks:>={min_forks}")
+        query = " ".join(qualifiers)
+
+        limit = max(limit, 0)
+        cache_key = (username_or_org, is_organization, limit, query, sort)
+        cached = self._get_cached_repos(cache_key)
+        if cached is not None:
+            logger.debug("Using cached search results for %s", username_or_org)
+            return cached
+
+        try:
+            logger.debug("Searching repositories with query: %s", query)
+
+            if sort:
+                results = self.github.search_repositories(
+                    query, sort=sort, order="desc"
+                )
+            else:
+                results = self.github.search_repositories(query)
+
+            repo_list = [
+                Repository.from_pygithub(repo) for repo in islice(results, limit)
+            ]
+
+            logger.info(
+                "Search returned %d repositories for %s",
+                len(repo_list),
+                username_or_org,
+            )
+            self._set_cached_repos(cache_key, repo_list)
+            return repo_list
+        except GithubException as e:
+            logger.error("Error searching repositories for %s: %s", username_or_org, e)
+            if e.status == 422 and _is_unsearchable_account(e):
+                raise ValueError(
+                    "GitHub user or organization not found. Please check the name "
+                    "and try again."
+                )
+            self._handle_github_exception(
+                e, f"searching repositories for {username_or_org}"
+            )
+            return []  # This line will never be reached, but satisfies mypy
+        except requests.exceptions.RetryError as e:
+            self._handle_retry_error(e, f"searching repositories for {username_or_org}")
+            return []  # This line will never be reached, but satisfies mypy
+        except requests.exceptions.Timeout:
+            raise ValueError(
+                f"Request timed out while searching repositories for {username_or_org}"
+            )
+        except requests.exceptions.ConnectionError:
+            raise ValueError(
+                "Network error while searching repositories. Check your internet "
+                "connection."
+            )
+        except Exception as e:
+            logger.error(
+                "Unexpected error searching repositories for %s: %s",
+                username_or_org,
+                e,
+            )
+            raise ValueError(f"Unexpected error searching repositories: {e}")
+
     def get_repo_stats(
         self, username_or_org: str, is_organization: bool = False, limit: int = 100
     ) -> Dict:
@@ -378,8 +637,8 @@ class GitHubAPI:
             total_forks += repo.forks_count
             total_size += repo.size
 
-        # Sort languages by count
-        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top languages by count, most used first
+        top_languages = heapq.nlargest(10, languages.items(), key=itemgetter(1))
 
         return {
             "total_repositories": total_repos,
@@ -1,14 +1,80 @@
 """Data models for GitHub Repository Analyzer."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Attributes copied as-is from PyGithub repository objects
+_PYGITHUB_FIELDS: Tuple[str, ...] = (
+    "name",
+    "full_name",
+    "description",
+    "html_url",
+    "clone_url",
+    "ssh_url",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "open_issues_count",
+    "size",
+    "private",
+    "archived",
+    "disabled",
+)
+_PYGITHUB_DATETIME_FIELDS: Tuple[str, ...] = ("created_at", "updated_at", "pushed_at")
+_OWNER_FIELDS: Tuple[str, ...] = ("login", "id", "type", "html_url", "avatar_url")
+_get_raw_fields = itemgetter(*_PYGITHUB_FIELDS)
+_get_attr_fields = attrgetter(*_PYGITHUB_FIELDS)
+
+
+def _isoformat(value: Any) -> Any:
+    """Return datetimes as ISO strings, leaving other values unchanged."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _raw_timestamp(value: Any) -> Any:
+    """Convert a payload timestamp to the format ``_isoformat`` produces.
+
+    GitHub sends UTC times as ``...Z``, while PyGithub parses them into
+    aware datetimes whose ``isoformat()`` ends in ``+00:00``.
+    """
+    if isinstance(value, str) and value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+def _scalar_fields(repo: Any, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the plain repository fields from a PyGithub object.
+
+    Tries the JSON payload first, then the object's attributes, each fetched
+    in a single C-level getter call. Only when both are incomplete does it
+    fall back to checking field by field.
+    """
+    try:
+        return dict(zip(_PYGITHUB_FIELDS, _get_raw_fields(raw)))
+    except KeyError:
+        pass
+    try:
+        return dict(zip(_PYGITHUB_FIELDS, _get_attr_fields(repo)))
+    except AttributeError:
+        pass
+    return {
+        field: raw[field] if field in raw else getattr(repo, field)
+        for field in _PYGITHUB_FIELDS
+        if field in raw or hasattr(repo, field)
+    }
 
 
 class Owner(BaseModel):
     """GitHub repository owner model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     login: str
     id: int
     type: str
@@ -17,7 +83,12 @@ class Owner(BaseModel):
 
 
 class Repository(BaseModel):
-    """Strongly typed Repository model using Pydantic."""
+    """Strongly typed Repository model using Pydantic.
+
+    Instances are immutable, so derived values can be cached safely.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     name: str
     full_name: str
@@ -44,72 +115,62 @@ class Repository(BaseModel):
     @classmethod
     def format_datetime(cls, v: Any) -> Any:
         """Format datetime objects to ISO strings."""
-        if isinstance(v, datetime):
-            return v.isoformat()
-        return v
+        return _isoformat(v)
 
     @field_validator("pushed_at", mode="before")
     @classmethod
     def format_pushed_at(cls, v: Any) -> Any:
         """Format pushed_at datetime to ISO string or None."""
-        if isinstance(v, datetime):
-            return v.isoformat()
-        return v
+        return _isoformat(v)
+
+    @cached_property
+    def language_lower(self) -> Optional[str]:
+        """Lowercased ``language`` for case-insensitive matching."""
+        return self.language.lower() if self.language else None
+
+    @cached_property
+    def updated_at_date(self) -> str:
+        """Date part of ``updated_at`` (YYYY-MM-DD), or "N/A" when missing."""
+        return self.updated_at[:10] if self.updated_at else "N/A"
 
     @classmethod
     def from_pygithub(cls, repo: Any) -> "Repository":
-        """Create Repository from PyGithub object - DRY approach."""
-        # Use Pydantic's model_validate with a dictionary comprehension
-        # This automatically handles field mapping and validation
-        data = {
-            # Direct field mapping
-            field: getattr(repo, field)
-            for field in [
-                "name",
-                "full_name",
-                "description",
-                "html_url",
-                "clone_url",
-                "ssh_url",
-                "language",
-                "stargazers_count",
-                "forks_count",
-                "open_issues_count",
-                "size",
-                "private",
-                "archived",
-                "disabled",
-            ]
-            if hasattr(repo, field)
-        }
-
-        # Add datetime fields (validators will handle formatting)
-        data.update(
-            {
-                "created_at": repo.created_at,
-                "updated_at": repo.updated_at,
-                "pushed_at": repo.pushed_at,
-            }
-        )
-
-        # Add owner (let Pydantic handle validation)
-        data["owner"] = {
-            "login": repo.owner.login,
-            "id": repo.owner.id,
-            "type": repo.owner.type,
-            "html_url": repo.owner.html_url,
-            "avatar_url": repo.owner.avatar_url,
-        }
-
-        # Add defaults
-        data.update(
-            {
-                "topics": [],  # Skip to avoid extra API calls
-                "license": None,  # Skip to avoid extra API calls
-            }
-        )
-
-        return cls.model_validate(data)
+        """Create Repository from PyGithub object.
+
+        Values are read from the JSON payload PyGithub already holds, falling
+        back to attribute access for anything missing from it. PyGithub
+        values are already correctly typed, so the model is built with
+        ``model_construct`` and skips validation. Use ``model_validate`` for
+        untrusted input instead.
+        """
+        # Read the payload directly; the public raw_data property may trigger
+        # a request to complete lazily loaded objects
+        raw = getattr(repo, "_rawData", None)
+        if not isinstance(raw, dict):
+            raw = {}
+
+        data = _scalar_fields(repo, raw)
+
+        # Datetimes are stored as ISO strings, identical for both sources
+        for field in _PYGITHUB_DATETIME_FIELDS:
+            data[field] = (
+                _raw_timestamp(raw[field])
+                if field in raw
+                else _isoformat(getattr(repo, field))
+            )
+
+        raw_owner = raw.get("owner")
+        if isinstance(raw_owner, dict):
+            owner_data = {field: raw_owner.get(field) for field in _OWNER_FIELDS}
+        else:
+            owner_data = {field: getattr(repo.owner, field) for field in _OWNER_FIELDS}
+        data["owner"] = Owner.model_construct(**owner_data)
+
+        # Skip topics and license to avoid extra API calls
+        data["topics"] = []
+        data["license"] = None
+
+        return cls.model_construct(**data)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Repository to dictionary for JSON serialization.
@@ -1,6 +1,10 @@
 """Service layer for GitHub Repository Analyzer."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from github_repo_analyzer.core.api import GitHubAPI
 from github_repo_analyzer.core.models import Repository
@@ -16,6 +20,30 @@ from github_repo_analyzer.validation import (
 
 logger = get_logger(__name__)
 
+# Sort fields that the GitHub Search API can order by server-side
+_SEARCH_SORT_FIELDS = {"stars": "stars", "forks": "forks", "updated": "updated"}
+
+# The GitHub Search API never returns more results than this for one query
+_SEARCH_RESULT_CAP = 1000
+
+# Sort key and direction (reverse) for each supported sort field
+_SORT_KEYS: Dict[str, Callable[[Repository], Any]] = {
+    "name": lambda r: r.name.lower(),
+    "stars": attrgetter("stargazers_count"),
+    "forks": attrgetter("forks_count"),
+    "updated": lambda r: r.updated_at or "",
+    "created": lambda r: r.created_at or "",
+    "size": attrgetter("size"),
+}
+_SORT_REVERSE = {
+    "name": False,
+    "stars": True,
+    "forks": True,
+    "updated": True,
+    "created": True,
+    "size": True,
+}
+
 
 class RepositoryService:
     """Service for repository analysis operations."""
@@ -55,9 +83,7 @@ class RepositoryService:
             sort_field=sort_field,
         )
 
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Get repository statistics
         stats = self.api.get_repo_stats(
@@ -75,12 +101,85 @@ class RepositoryService:
         # Update stats with sorted repositories
         stats["repositories"] = sorted_repos
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         log_performance(logger, f"analyze repositories for {username_or_org}", duration)
 
         logger.info("Analysis complete: %d repositories processed", len(sorted_repos))
         return stats
 
+    async def analyze_repositories_async(
+        self,
+        username_or_org: str,
+        is_organization: bool = False,
+        limit: int = 100,
+        sort_field: str = "updated",
+    ) -> Dict[str, Any]:
+        """Analyze repositories without blocking the event loop.
+
+        The blocking PyGithub calls run in the loop's default executor.
+
+        Args:
+            username_or_org: GitHub username or organization name
+            is_organization: Whether the target is an organization
+            limit: Maximum number of repositories to fetch
+            sort_field: Field to sort repositories by
+
+        Returns:
+            Dictionary containing repository statistics and sorted repositories
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.analyze_repositories,
+                username_or_org,
+                is_organization=is_organization,
+                limit=limit,
+                sort_field=sort_field,
+            ),
+        )
+
+    async def analyze_many(
+        self,
+        targets: Iterable[str],
+        is_organization: bool = False,
+        limit: int = 100,
+        sort_field: str = "updated",
+        max_workers: int = 16,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze several users or organizations concurrently.
+
+        Calls run in the loop's default executor, so cancelling this
+        coroutine never waits on an executor shutdown.
+
+        Args:
+            targets: GitHub usernames or organization names
+            is_organization: Whether the targets are organizations
+            limit: Maximum number of repositories to fetch per target
+            sort_field: Field to sort repositories by
+            max_workers: Maximum number of concurrent API calls
+
+        Returns:
+            Dictionary mapping each target to its analysis result
+        """
+        target_list = list(targets)
+        # Every call shares one PyGithub client, so bound the calls in flight
+        # here instead of relying on the executor's size
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _analyze(target: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_repositories_async(
+                    target,
+                    is_organization=is_organization,
+                    limit=limit,
+                    sort_field=sort_field,
+                )
+
+        results = await asyncio.gather(*(_analyze(target) for target in target_list))
+
+        return dict(zip(target_list, results))
+
     def _apply_filters(
         self,
         repos: List[Repository],
@@ -103,30 +202,26 @@ class RepositoryService:
         Returns:
             Filtered list of repositories
         """
-        filtered_repos = repos
-
-        if language:
-            filtered_repos = [
-                r
-                for r in filtered_repos
-                if r.language and r.language.lower() == language.lower()
-            ]
-
-        if min_stars is not None:
-            filtered_repos = [
-                r for r in filtered_repos if r.stargazers_count >= min_stars
-            ]
-
-        if min_forks is not None:
-            filtered_repos = [r for r in filtered_repos if r.forks_count >= min_forks]
-
-        if public_only:
-            filtered_repos = [r for r in filtered_repos if not r.private]
-
-        if private_only:
-            filtered_repos = [r for r in filtered_repos if r.private]
+        if not (
+            language
+            or min_stars is not None
+            or min_forks is not None
+            or public_only
+            or private_only
+        ):
+            return repos
 
-        return filtered_repos
+        # Evaluate every predicate in a single pass over the repositories
+        language_lower = language.lower() if language else None
+        return [
+            r
+            for r in repos
+            if (language_lower is None or r.language_lower == language_lower)
+            and (min_stars is None or r.stargazers_count >= min_stars)
+            and (min_forks is None or r.forks_count >= min_forks)
+            and not (public_only and r.private)
+            and not (private_only and not r.private)
+        ]
 
     def _sort_repositories(
         self, repos: List[Repository], sort_field: str
@@ -140,23 +235,12 @@ class RepositoryService:
         Returns:
             Sorted list of repositories
         """
-        if not repos:
+        if not repos or sort_field not in _SORT_KEYS:
             return repos
 
-        if sort_field == "name":
-            return sorted(repos, key=lambda r: r.name.lower())
-        elif sort_field == "stars":
-            return sorted(repos, key=lambda r: r.stargazers_count, reverse=True)
-        elif sort_field == "forks":
-            return sorted(repos, key=lambda r: r.forks_count, reverse=True)
-        elif sort_field == "updated":
-            return sorted(repos, key=lambda r: r.updated_at or "", reverse=True)
-        elif sort_field == "created":
-            return sorted(repos, key=lambda r: r.created_at or "", reverse=True)
-        elif sort_field == "size":
-            return sorted(repos, key=lambda r: r.size, reverse=True)
-        else:
-            return repos
+        return sorted(
+            repos, key=_SORT_KEYS[sort_field], reverse=_SORT_REVERSE[sort_field]
+        )
 
     def validate_inputs(
         self,
@@ -200,6 +284,13 @@ class RepositoryService:
     ) -> List[Repository]:
         """Search and filter repositories for a user or organization.
 
+        Language and non-zero star/fork filters are sent to the GitHub Search
+        API when the limit fits in its 1000-result cap. The Search API only
+        indexes forks with more stars than their parent and can lag behind
+        recent pushes, so those searches may omit such repositories. Without
+        such filters, or with a larger limit, repositories are listed and
+        filtered locally.
+
         Args:
             username_or_org: GitHub username or organization name
             is_organization: Whether the target is an organization
@@ -225,19 +316,36 @@ class RepositoryService:
             private_only,
         )
 
-        # Get all repositories
-        stats = self.analyze_repositories(
-            username_or_org=username_or_org,
-            is_organization=is_organization,
-            limit=limit,
-            sort_field=sort_field,
-        )
+        if (language or min_stars or min_forks) and limit <= _SEARCH_RESULT_CAP:
+            # Let the Search API evaluate the filters it can express
+            repos = self.api.search_repos(
+                username_or_org,
+                is_organization=is_organization,
+                language=language,
+                min_stars=min_stars,
+                min_forks=min_forks,
+                sort=_SEARCH_SORT_FIELDS.get(sort_field),
+                limit=limit,
+            )
+        else:
+            # Get all repositories
+            stats = self.analyze_repositories(
+                username_or_org=username_or_org,
+                is_organization=is_organization,
+                limit=limit,
+                sort_field=sort_field,
+            )
 
-        repos = stats["repositories"]
+            repos = stats.get("repositories", [])
 
-        # Apply filters
+        # Listings still need every filter; visibility cannot be searched for
         filtered_repos = self._apply_filters(
-            repos, language, min_stars, min_forks, public_only, private_only
+            repos,
+            language=language,
+            min_stars=min_stars,
+            min_forks=min_forks,
+            public_only=public_only,
+            private_only=private_only,
         )
 
         # Sort repositories
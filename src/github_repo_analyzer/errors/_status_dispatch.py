@@ -0,0 +1,123 @@
+"""Status code dispatch for GitHub API exceptions.
+
+This module maps HTTP status codes returned by the GitHub API to the
+custom exception that should be raised for them. It is shared by
+``ErrorHandler.handle_github_exception`` and ``convert_github_exception``.
+"""
+
+from typing import Callable, Dict, Optional
+
+from github_repo_analyzer.errors.context import ErrorContext
+from github_repo_analyzer.errors.exceptions import (
+    APIError,
+    AuthenticationError,
+    GitHubRepoAnalyzerError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+)
+
+StatusConverter = Callable[[str, Exception, ErrorContext], GitHubRepoAnalyzerError]
+
+# Fixed user-facing messages, shared by every converted exception
+_MSG_INVALID_TOKEN = "Invalid GitHub token. Please check your token and try again."
+_MSG_RATE_LIMITED = (
+    "GitHub API rate limit exceeded. Please wait before trying again. "
+    "Consider using a personal access token for higher limits."
+)
+_MSG_FORBIDDEN = (
+    "GitHub API access forbidden. Your token may lack required permissions."
+)
+_MSG_NOT_FOUND = (
+    "GitHub user or organization not found. Please check the name and try again."
+)
+
+
+def _auth_invalid(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    return AuthenticationError(
+        _MSG_INVALID_TOKEN,
+        context=context,
+        cause=exception,
+    )
+
+
+def _rate_limited(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    return RateLimitError(
+        _MSG_RATE_LIMITED,
+        context=context,
+        cause=exception,
+    )
+
+
+def _forbidden_or_rate_limited(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    # GitHub reports primary rate limits as 403 with an explanatory message
+    if "rate limit" in str(exception).lower():
+        return _rate_limited(operation, exception, context)
+    return AuthenticationError(
+        _MSG_FORBIDDEN,
+        context=context,
+        cause=exception,
+    )
+
+
+def _not_found(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    return NotFoundError(
+        _MSG_NOT_FOUND,
+        context=context,
+        cause=exception,
+    )
+
+
+def _invalid_request(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    return ValidationError(
+        f"Invalid request: {exception}", context=context, cause=exception
+    )
+
+
+def _api_error(
+    operation: str, exception: Exception, context: ErrorContext
+) -> GitHubRepoAnalyzerError:
+    return APIError(
+        f"GitHub API error during {operation}: {exception}",
+        context=context,
+        cause=exception,
+    )
+
+
+_STATUS_MAP: Dict[Optional[int], StatusConverter] = {
+    401: _auth_invalid,
+    403: _forbidden_or_rate_limited,
+    404: _not_found,
+    422: _invalid_request,
+    429: _rate_limited,
+}
+
+
+def convert_status(
+    status_code: Optional[int],
+    operation: str,
+    exception: Exception,
+    context: ErrorContext,
+) -> GitHubRepoAnalyzerError:
+    """Convert a GitHub API exception based on its HTTP status code.
+
+    Args:
+        status_code: HTTP status code of the failed request
+        operation: Description of the operation that failed
+        exception: The original GitHub exception
+        context: Error context to attach to the converted exception
+
+    Returns:
+        Appropriate custom exception (APIError for unmapped status codes)
+    """
+    return _STATUS_MAP.get(status_code, _api_error)(operation, exception, context)
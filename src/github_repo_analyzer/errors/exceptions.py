@@ -4,7 +4,7 @@ This module defines a comprehensive exception hierarchy that provides
 clear error categorization and context for different types of failures.
 """
 
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from github_repo_analyzer.errors.context import ErrorContext
 
@@ -14,8 +14,14 @@ class GitHubRepoAnalyzerError(Exception):
 
     This is the root exception class that all other custom exceptions
     inherit from, providing a common interface for error handling.
+
+    Subclasses set ``LABEL`` and ``TIP`` to control how they are presented
+    to the user by ``format_error_message`` and ``get_error_tip``.
     """
 
+    LABEL: ClassVar[str] = "Error"
+    TIP: ClassVar[Optional[str]] = None
+
     def __init__(
         self,
         message: str,
@@ -31,8 +37,15 @@ class GitHubRepoAnalyzerError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.context = context or ErrorContext()
-        self.cause = cause
+        self.context = context if context is not None else ErrorContext()
+        # Stored as the standard exception chain; ``raise ... from`` reuses it.
+        # Python only accepts exception instances here, so anything else is dropped.
+        self.__cause__ = cause if isinstance(cause, BaseException) else None
+
+    @property
+    def cause(self) -> Optional[BaseException]:
+        """Return the underlying exception that caused this error."""
+        return self.__cause__
 
     def __str__(self) -> str:
         """Return string representation of the error."""
@@ -44,6 +57,9 @@ class GitHubRepoAnalyzerError(Exception):
 class AuthenticationError(GitHubRepoAnalyzerError):
     """Raised when authentication fails or token is invalid."""
 
+    LABEL = "Authentication Error"
+    TIP = "Tip: Set GITHUB_TOKEN environment variable or use --token option"
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -56,6 +72,12 @@ class AuthenticationError(GitHubRepoAnalyzerError):
 class RateLimitError(GitHubRepoAnalyzerError):
     """Raised when GitHub API rate limit is exceeded."""
 
+    LABEL = "Rate Limit Error"
+    TIP = (
+        "Tip: Wait a few minutes before trying again, or use a personal "
+        "access token for higher limits"
+    )
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -68,6 +90,9 @@ class RateLimitError(GitHubRepoAnalyzerError):
 class NotFoundError(GitHubRepoAnalyzerError):
     """Raised when a requested resource is not found."""
 
+    LABEL = "Not Found Error"
+    TIP = "Tip: Check the username or organization name is correct"
+
     def __init__(
         self,
         message: str = "Resource not found",
@@ -80,6 +105,9 @@ class NotFoundError(GitHubRepoAnalyzerError):
 class NetworkError(GitHubRepoAnalyzerError):
     """Raised when network-related errors occur."""
 
+    LABEL = "Network Error"
+    TIP = "Tip: Check your internet connection and try again"
+
     def __init__(
         self,
         message: str = "Network error occurred",
@@ -92,6 +120,9 @@ class NetworkError(GitHubRepoAnalyzerError):
 class ValidationError(GitHubRepoAnalyzerError):
     """Raised when input validation fails."""
 
+    LABEL = "Validation Error"
+    TIP = "Tip: Check your input values are valid"
+
     def __init__(
         self,
         message: str = "Validation failed",
@@ -102,16 +133,20 @@ class ValidationError(GitHubRepoAnalyzerError):
     ) -> None:
         if context is None:
             context = ErrorContext(field=field, value=value)
-        elif field is not None:
-            context.field = field
-        if value is not None:
-            context.value = value
+        else:
+            if field is not None:
+                context.field = field
+            if value is not None:
+                context.value = value
         super().__init__(message, context, cause)
 
 
 class ConfigurationError(GitHubRepoAnalyzerError):
     """Raised when configuration is invalid or missing."""
 
+    LABEL = "Configuration Error"
+    TIP = "Tip: Check your configuration settings"
+
     def __init__(
         self,
         message: str = "Configuration error",
@@ -124,6 +159,9 @@ class ConfigurationError(GitHubRepoAnalyzerError):
 class APIError(GitHubRepoAnalyzerError):
     """Raised when GitHub API returns an error."""
 
+    LABEL = "API Error"
+    TIP = "Tip: Check the GitHub API status and try again later"
+
     def __init__(
         self,
         message: str = "API error occurred",
@@ -141,6 +179,9 @@ class APIError(GitHubRepoAnalyzerError):
 class CacheError(GitHubRepoAnalyzerError):
     """Raised when cache operations fail."""
 
+    LABEL = "Cache Error"
+    TIP = "Tip: Try clearing the cache with --no-cache option"
+
     def __init__(
         self,
         message: str = "Cache error occurred",
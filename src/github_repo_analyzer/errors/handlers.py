@@ -9,21 +9,16 @@ import logging
 from functools import wraps
 from typing import Any, Callable, Optional
 
+from github_repo_analyzer.errors._status_dispatch import convert_status
 from github_repo_analyzer.errors.context import (
     create_api_context,
     create_network_context,
     create_validation_context,
 )
 from github_repo_analyzer.errors.exceptions import (
-    APIError,
-    AuthenticationError,
-    CacheError,
-    ConfigurationError,
     ErrorContext,
     GitHubRepoAnalyzerError,
     NetworkError,
-    NotFoundError,
-    RateLimitError,
     ValidationError,
 )
 
@@ -59,54 +54,7 @@ class ErrorHandler:
             status_code = getattr(exception, "status")
             context.status_code = status_code
 
-        # Map status codes to appropriate exceptions
-        if status_code == 401:
-            return AuthenticationError(
-                "Invalid GitHub token. Please check your token and try again.",
-                context=context,
-                cause=exception,
-            )
-        elif status_code == 403:
-            if "rate limit" in str(exception).lower():
-                return RateLimitError(
-                    "GitHub API rate limit exceeded. Please wait before trying "
-                    "again. Consider using a personal access token for higher "
-                    "limits.",
-                    context=context,
-                    cause=exception,
-                )
-            else:
-                return AuthenticationError(
-                    "GitHub API access forbidden. Your token may lack required "
-                    "permissions.",
-                    context=context,
-                    cause=exception,
-                )
-        elif status_code == 404:
-            return NotFoundError(
-                "GitHub user or organization not found. Please check the name "
-                "and try again.",
-                context=context,
-                cause=exception,
-            )
-        elif status_code == 422:
-            return ValidationError(
-                f"Invalid request: {exception}", context=context, cause=exception
-            )
-        elif status_code == 429:
-            return RateLimitError(
-                "GitHub API rate limit exceeded. Please wait before trying "
-                "again. Consider using a personal access token for higher "
-                "limits.",
-                context=context,
-                cause=exception,
-            )
-        else:
-            return APIError(
-                f"GitHub API error during {operation}: {exception}",
-                context=context,
-                cause=exception,
-            )
+        return convert_status(status_code, operation, exception, context)
 
     def handle_network_exception(
         self, exception: Exception, operation: str
@@ -121,13 +69,14 @@ class ErrorHandler:
             NetworkError with appropriate context
         """
         context = create_network_context(operation)
+        error_text = str(exception).lower()
 
-        if "timeout" in str(exception).lower():
+        if "timeout" in error_text:
             message = (
                 f"Request timeout during {operation}. Please check your "
                 "connection and try again."
             )
-        elif "connection" in str(exception).lower():
+        elif "connection" in error_text:
             message = (
                 f"Connection error during {operation}. Please check your "
                 "internet connection."
@@ -172,16 +121,18 @@ def handle_error(
     Returns:
         Appropriate custom exception
     """
-    handler = ErrorHandler(logger)
-
     # If it's already our custom exception, return as-is
     if isinstance(error, GitHubRepoAnalyzerError):
         return error
 
+    handler = ErrorHandler(logger)
+
     # Handle specific exception types
     if hasattr(error, "status"):  # GitHub API exception
         return handler.handle_github_exception(error, operation or "unknown operation")
-    elif "timeout" in str(error).lower() or "connection" in str(error).lower():
+
+    error_text = str(error).lower()
+    if "timeout" in error_text or "connection" in error_text:
         return handler.handle_network_exception(error, operation or "network operation")
     elif isinstance(error, ValueError):
         return handler.handle_validation_exception(error, operation=operation)
@@ -202,26 +153,9 @@ def format_error_message(error: GitHubRepoAnalyzerError) -> str:
     Returns:
         Formatted error message
     """
-    if isinstance(error, AuthenticationError):
-        return f"Authentication Error: {error.message}"
-    elif isinstance(error, RateLimitError):
-        return f"Rate Limit Error: {error.message}"
-    elif isinstance(error, NotFoundError):
-        return f"Not Found Error: {error.message}"
-    elif isinstance(error, NetworkError):
-        return f"Network Error: {error.message}"
-    elif isinstance(error, ValidationError):
-        if error.context.field:
-            return f"Validation Error ({error.context.field}): {error.message}"
-        return f"Validation Error: {error.message}"
-    elif isinstance(error, ConfigurationError):
-        return f"Configuration Error: {error.message}"
-    elif isinstance(error, APIError):
-        return f"API Error: {error.message}"
-    elif isinstance(error, CacheError):
-        return f"Cache Error: {error.message}"
-    else:
-        return f"Error: {error.message}"
+    if isinstance(error, ValidationError) and error.context.field:
+        return f"{error.LABEL} ({error.context.field}): {error.message}"
+    return f"{error.LABEL}: {error.message}"
 
 
 def get_error_tip(error: GitHubRepoAnalyzerError) -> Optional[str]:
@@ -233,29 +167,9 @@ def get_error_tip(error: GitHubRepoAnalyzerError) -> Optional[str]:
     Returns:
         Helpful tip string or None
     """
-    if isinstance(error, AuthenticationError):
-        return "Tip: Set GITHUB_TOKEN environment variable or use --token option"
-    elif isinstance(error, RateLimitError):
-        return (
-            "Tip: Wait a few minutes before trying again, or use a personal "
-            "access token for higher limits"
-        )
-    elif isinstance(error, NotFoundError):
-        return "Tip: Check the username or organization name is correct"
-    elif isinstance(error, NetworkError):
-        return "Tip: Check your internet connection and try again"
-    elif isinstance(error, ValidationError):
-        if error.context.field:
-            return f"Tip: Check the {error.context.field} value is valid"
-        return "Tip: Check your input values are valid"
-    elif isinstance(error, ConfigurationError):
-        return "Tip: Check your configuration settings"
-    elif isinstance(error, APIError):
-        return "Tip: Check the GitHub API status and try again later"
-    elif isinstance(error, CacheError):
-        return "Tip: Try clearing the cache with --no-cache option"
-
-    return None
+    if isinstance(error, ValidationError) and error.context.field:
+        return f"Tip: Check the {error.context.field} value is valid"
+    return error.TIP
 
 
 def log_error_with_context(
@@ -269,20 +183,24 @@ def log_error_with_context(
         context: Additional context information
     """
     context_msg = f" in {context}" if context else ""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     if isinstance(error, GitHubRepoAnalyzerError):
         logger.error(
             "Error%s: %s: %s", context_msg, type(error).__name__, error.message
         )
 
-        # Log context information if available
-        if error.context and error.context.to_dict():
-            logger.debug("Error context%s: %s", context_msg, error.context.to_dict())
+        # Log context information if available (skip building it otherwise)
+        if debug_enabled:
+            context_dict = error.context.to_dict()
+            if context_dict:
+                logger.debug("Error context%s: %s", context_msg, context_dict)
     else:
         logger.error("Error%s: %s: %s", context_msg, type(error).__name__, error)
 
     # Log full traceback for debugging
-    logger.debug("Full traceback%s:", context_msg, exc_info=True)
+    if debug_enabled:
+        logger.debug("Full traceback%s:", context_msg, exc_info=True)
 
 
 def error_handler(
@@ -303,10 +221,15 @@ def error_handler(
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
+            except GitHubRepoAnalyzerError as e:
+                # Already converted, propagate without building a new error
+                if reraise:
+                    raise
+                return e
             except Exception as e:
                 converted_error = handle_error(e, operation)
                 if reraise:
-                    raise converted_error
+                    raise converted_error from e
                 return converted_error
 
         return wrapper
@@ -9,19 +9,16 @@ from typing import Optional
 import requests.exceptions
 from github import GithubException
 
+from github_repo_analyzer.errors._status_dispatch import convert_status
 from github_repo_analyzer.errors.context import (
     create_api_context,
     create_network_context,
     create_validation_context,
 )
 from github_repo_analyzer.errors.exceptions import (
-    APIError,
-    AuthenticationError,
     ConfigurationError,
     GitHubRepoAnalyzerError,
     NetworkError,
-    NotFoundError,
-    RateLimitError,
     ValidationError,
 )
 
@@ -41,53 +38,7 @@ def convert_github_exception(
     status_code = getattr(exception, "status", None)
     context = create_api_context(operation, status_code=status_code)
 
-    if status_code == 401:
-        return AuthenticationError(
-            "Invalid GitHub token. Please check your token and try again.",
-            context=context,
-            cause=exception,
-        )
-    elif status_code == 403:
-        if "rate limit" in str(exception).lower():
-            return RateLimitError(
-                "GitHub API rate limit exceeded. Please wait before trying "
-                "again. Consider using a personal access token for higher "
-                "limits.",
-                context=context,
-                cause=exception,
-            )
-        else:
-            return AuthenticationError(
-                "GitHub API access forbidden. Your token may lack required "
-                "permissions.",
-                context=context,
-                cause=exception,
-            )
-    elif status_code == 404:
-        return NotFoundError(
-            "GitHub user or organization not found. Please check the name "
-            "and try again.",
-            context=context,
-            cause=exception,
-        )
-    elif status_code == 422:
-        return ValidationError(
-            f"Invalid request: {exception}", context=context, cause=exception
-        )
-    elif status_code == 429:
-        return RateLimitError(
-            "GitHub API rate limit exceeded. Please wait before trying "
-            "again. Consider using a personal access token for higher "
-            "limits.",
-            context=context,
-            cause=exception,
-        )
-    else:
-        return APIError(
-            f"GitHub API error during {operation}: {exception}",
-            context=context,
-            cause=exception,
-        )
+    return convert_status(status_code, operation, exception, context)
 
 
 def convert_network_exception(
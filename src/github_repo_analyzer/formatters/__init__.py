@@ -1,10 +1,12 @@
 """Output formatters for GitHub Repository Analyzer."""
 
+from .console import console
 from .json import display_json
 from .summary import display_summary
 from .table import display_table
 
 __all__ = [
+    "console",
     "display_json",
     "display_summary",
     "display_table",
@@ -0,0 +1,6 @@
+"""Shared Rich console for GitHub Repository Analyzer output."""
+
+from rich.console import Console
+
+# A single console instance is shared by all formatters and commands
+console = Console()
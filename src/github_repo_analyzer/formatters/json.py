@@ -1,14 +1,23 @@
 """JSON formatter for GitHub Repository Analyzer."""
 
 import json
+import sys
 from typing import List
 
 from github_repo_analyzer.core import Repository
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 def display_json(repos: List[Repository]) -> None:
     """Display repositories in JSON format.
 
+    Uses ``orjson`` when it is installed, falling back to the standard
+    library ``json`` module otherwise.
+
     Args:
         repos: List of Repository objects to display
     """
@@ -19,5 +28,20 @@ def display_json(repos: List[Repository]) -> None:
     # Convert repositories to dictionaries
     repo_dicts = [repo.to_dict() for repo in repos]
 
-    # Pretty print JSON
-    print(json.dumps(repo_dicts, indent=2, default=str))
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Write the encoded bytes directly to skip a decode/encode round-trip
+        sys.stdout.flush()
+        buffer.write(
+            orjson.dumps(
+                repo_dicts,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+
+    # Pretty print JSON, keeping non-ASCII characters as-is
+    print(json.dumps(repo_dicts, indent=2, ensure_ascii=False, default=str))
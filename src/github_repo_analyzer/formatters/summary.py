@@ -2,10 +2,9 @@
 
 from typing import Any, Dict
 
-from rich.console import Console
 from rich.panel import Panel
 
-console = Console()
+from github_repo_analyzer.formatters.console import console
 
 
 def display_summary(stats: Dict[str, Any], username_or_org: str, is_org: bool) -> None:
@@ -20,14 +19,23 @@ def display_summary(stats: Dict[str, Any], username_or_org: str, is_org: bool) -
         console.print("[red]No statistics available.[/red]")
         return
 
-    # Extract statistics
+    # Extract statistics (keys match GitHubAPI.get_repo_stats)
     total_repos = stats.get("total_repositories", 0)
     total_stars = stats.get("total_stars", 0)
     total_forks = stats.get("total_forks", 0)
-    total_size = stats.get("total_size", 0)
-    languages = stats.get("languages", {})
-    private_count = stats.get("private_count", 0)
-    archived_count = stats.get("archived_count", 0)
+    total_size = stats.get("total_size_mb", 0)
+    top_languages = stats.get("top_languages", [])
+    private_count = stats.get("private_repositories", 0)
+    archived_count = stats.get("archived_repositories", 0)
+
+    # Languages arrive presorted by repository count, most used first
+    if top_languages:
+        language_lines = "\n".join(
+            f"• {lang}: [green]{count}[/green] repositories"
+            for lang, count in top_languages[:5]
+        )
+    else:
+        language_lines = "• No language data available"
 
     # Create summary text
     entity_type = "Organization" if is_org else "User"
@@ -43,16 +51,9 @@ def display_summary(stats: Dict[str, Any], username_or_org: str, is_org: bool) -
 • Archived Repositories: [dim]{archived_count}[/dim]
 
 [bold]💻 Top Languages:[/bold]
+{language_lines}
 """
 
-    # Add top languages
-    if languages:
-        sorted_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)
-        for lang, count in sorted_languages[:5]:  # Top 5 languages
-            summary_text += f"• {lang}: [green]{count}[/green] repositories\n"
-    else:
-        summary_text += "• No language data available\n"
-
     # Create and display panel
     panel = Panel(
         summary_text.strip(),
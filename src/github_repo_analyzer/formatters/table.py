@@ -1,13 +1,47 @@
 """Table formatter for GitHub Repository Analyzer."""
 
-from typing import List
+from typing import Any, Dict, List, Tuple
 
-from rich.console import Console
 from rich.table import Table
 
 from github_repo_analyzer.core import Repository
+from github_repo_analyzer.formatters.console import console
 
-console = Console()
+# Column headers and their Rich options, in display order
+_TABLE_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("Name", {"style": "cyan", "no_wrap": True}),
+    ("Language", {"style": "magenta"}),
+    ("Stars", {"justify": "right", "style": "yellow"}),
+    ("Forks", {"justify": "right", "style": "green"}),
+    ("Size (MB)", {"justify": "right", "style": "blue"}),
+    ("Private", {"justify": "center", "style": "red"}),
+    ("Archived", {"justify": "center", "style": "dim"}),
+    ("Updated", {"style": "dim"}),
+)
+
+
+def _build_rows(repos: List[Repository]) -> List[Tuple[str, ...]]:
+    """Build the formatted table cells for each repository.
+
+    Args:
+        repos: List of Repository objects
+
+    Returns:
+        One tuple of cell strings per repository, in column order
+    """
+    return [
+        (
+            r.name,
+            r.language or "N/A",
+            str(r.stargazers_count),
+            str(r.forks_count),
+            f"{r.size / 1024:.1f}",  # GitHub reports size in KB
+            "✓" if r.private else "✗",
+            "✓" if r.archived else "✗",
+            r.updated_at_date,
+        )
+        for r in repos
+    ]
 
 
 def display_table(repos: List[Repository], username_or_org: str, is_org: bool) -> None:
@@ -27,26 +61,11 @@ def display_table(repos: List[Repository], username_or_org: str, is_org: bool) -
     table = Table(title=f"Repositories for {entity_type}: {username_or_org}")
 
     # Add columns
-    table.add_column("Name", style="cyan", no_wrap=True)
-    table.add_column("Language", style="magenta")
-    table.add_column("Stars", justify="right", style="yellow")
-    table.add_column("Forks", justify="right", style="green")
-    table.add_column("Size (MB)", justify="right", style="blue")
-    table.add_column("Private", justify="center", style="red")
-    table.add_column("Archived", justify="center", style="dim")
-    table.add_column("Updated", style="dim")
+    for header, options in _TABLE_COLUMNS:
+        table.add_column(header, **options)
 
     # Add rows
-    for repo in repos:
-        table.add_row(
-            repo.name,
-            repo.language or "N/A",
-            str(repo.stargazers_count),
-            str(repo.forks_count),
-            f"{repo.size:.1f}",
-            "✓" if repo.private else "✗",
-            "✓" if repo.archived else "✗",
-            repo.updated_at[:10],  # Extract date part from ISO string
-        )
+    for row in _build_rows(repos):
+        table.add_row(*row)
 
     console.print(table)
@@ -2,6 +2,7 @@
 
 from .setup import (
     ColoredFormatter,
+    FastRotatingFileHandler,
     cleanup_old_logs,
     get_default_log_dir,
     get_default_log_file,
@@ -15,6 +16,7 @@ from .setup import (
 
 __all__ = [
     "ColoredFormatter",
+    "FastRotatingFileHandler",
     "cleanup_old_logs",
     "get_default_log_dir",
     "get_default_log_file",
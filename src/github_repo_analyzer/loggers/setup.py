@@ -1,19 +1,42 @@
 """Professional logging configuration for GitHub Repository Analyzer."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from github_repo_analyzer.config import LoggingConfig
 
+# Background listener that writes queued records to the log file
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
+
+def _stop_queue_listener() -> None:
+    """Stop the file logging listener, flushing any queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+@lru_cache(maxsize=1)
 def get_default_log_dir() -> Path:
     """Get platform-appropriate default log directory.
 
+    The directory is created on first use and cached for the process lifetime.
+
     Returns:
         Path to the log directory following platform conventions:
         - Windows: %APPDATA%\\github-repo-analyzer\\logs
@@ -44,8 +67,21 @@ def get_default_log_file() -> str:
     Returns:
         Path to today's log file
     """
+    return _get_log_file_for_day(date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _get_log_file_for_day(day: int) -> str:
+    """Build the log file path for a day, cached until the date changes.
+
+    Args:
+        day: Proleptic Gregorian ordinal of the date
+
+    Returns:
+        Path to the log file for that day
+    """
     log_dir = get_default_log_dir()
-    date_str = datetime.now().strftime("%Y-%m-%d")
+    date_str = date.fromordinal(day).strftime("%Y-%m-%d")
     return str(log_dir / f"github-repo-analyzer-{date_str}.log")
 
 
@@ -57,15 +93,94 @@ def cleanup_old_logs(log_dir: Path, max_files: int = 7) -> None:
         max_files: Maximum number of log files to keep
     """
     try:
-        log_files = sorted(log_dir.glob("github-repo-analyzer-*.log"))
-        if len(log_files) > max_files:
-            for old_log in log_files[:-max_files]:
-                old_log.unlink()
+        with os.scandir(log_dir) as it:
+            log_files = [
+                entry
+                for entry in it
+                if entry.name.startswith("github-repo-analyzer-")
+                and entry.name.endswith(".log")
+            ]
+        if len(log_files) <= max_files:
+            return
+
+        # Oldest first; only stat when there is something to remove
+        log_files.sort(key=lambda entry: entry.stat().st_mtime)
+        for old_log in log_files[: len(log_files) - max_files]:
+            os.unlink(old_log.path)
     except Exception:
         # Silently ignore cleanup errors
         pass
 
 
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks the file size itself.
+
+    The standard handler checks the file on disk for every record. This one
+    keeps a running byte count and only defers to the real rollover check
+    once the file is close to ``maxBytes``.
+    """
+
+    # Headroom before the real rollover check is used
+    ROLLOVER_MARGIN = 256
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the handler and seed the size from the existing file."""
+        super().__init__(*args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record and count the bytes it added to the file.
+
+        This mirrors the base handler's emit so each record is formatted only
+        once, and only lines that were actually written are counted.
+        """
+        if self.maxBytes <= 0:
+            super().emit(record)
+            return
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            line = self.format(record) + self.terminator
+            self.stream.write(line)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        if line.isascii():
+            self._bytes_written += len(line)
+        else:
+            encoding = self.encoding or "utf-8"
+            self._bytes_written += len(line.encode(encoding, errors="replace"))
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        """Only check the file on disk when it is close to the size limit."""
+        if self.maxBytes <= 0:
+            return False
+        if self._bytes_written + self.ROLLOVER_MARGIN < self.maxBytes:
+            return False
+        return super().shouldRollover(record)
+
+    def doRollover(self) -> None:
+        """Roll over the file and reset the byte count."""
+        super().doRollover()
+        self._bytes_written = 0
+
+
+# The levelname field for each format style, including any width or alignment
+_LEVELNAME_FIELDS: Dict[type, "re.Pattern[str]"] = {
+    logging.PercentStyle: re.compile(r"%\(levelname\)[-#0 +]*\d*s"),
+    logging.StrFormatStyle: re.compile(r"\{levelname(?:![rsa])?(?::[^{}]*)?\}"),
+    logging.StringTemplateStyle: re.compile(r"\$(?:levelname\b|\{levelname\})"),
+}
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels."""
 
@@ -83,6 +198,29 @@ class ColoredFormatter(logging.Formatter):
         """Initialize formatter with color support detection."""
         super().__init__(*args, **kwargs)
         self._colors_enabled = self._supports_color()
+        self._level_styles = self._build_level_styles()
+
+    def _build_level_styles(self) -> Dict[int, Any]:
+        """Build one format style per level with the color baked into its format.
+
+        The styles only render the message line; times, exceptions and stack
+        info are still produced by this formatter, so ``converter`` and
+        ``formatTime`` overrides keep working. Formats without a level name
+        field are left uncolored.
+        """
+        style_class = type(self._style)
+        field = _LEVELNAME_FIELDS.get(style_class)
+        if field is None or not self._fmt or not field.search(self._fmt):
+            return {}
+
+        reset = self.COLORS["RESET"]
+        styles: Dict[int, Any] = {}
+        for level, color in self.COLORS.items():
+            if level == "RESET":
+                continue
+            fmt = field.sub(f"{color}\\g<0>{reset}", self._fmt)
+            styles[getattr(logging, level)] = style_class(fmt)
+        return styles
 
     def _supports_color(self) -> bool:
         """Check if terminal supports colors."""
@@ -101,39 +239,20 @@ class ColoredFormatter(logging.Formatter):
         # Default to True for most modern terminals
         return True
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors."""
-        if self._colors_enabled and record.levelname in self.COLORS:
-            # Create a copy of the record to avoid modifying the original
-            record_copy = logging.LogRecord(
-                record.name,
-                record.levelno,
-                record.pathname,
-                record.lineno,
-                record.msg,
-                record.args,
-                record.exc_info,
-            )
-            record_copy.levelname = (
-                f"{self.COLORS[record.levelname]}{record.levelname}"
-                f"{self.COLORS['RESET']}"
-            )
-            # Copy other attributes
-            for key, value in record.__dict__.items():
-                if key not in (
-                    "name",
-                    "levelno",
-                    "pathname",
-                    "lineno",
-                    "msg",
-                    "args",
-                    "exc_info",
-                    "levelname",
-                ):
-                    setattr(record_copy, key, value)
-            return super().format(record_copy)
-
-        return super().format(record)
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Render the record with its level's colored format."""
+        if self._colors_enabled:
+            style = self._level_styles.get(record.levelno)
+            if style is not None:
+                return str(style.format(record))
+        return super().formatMessage(record)
+
+
+_FILE_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+_FILE_FORMAT_WITH_CALLER = (
+    "%(asctime)s | %(levelname)-8s | %(name)s | "
+    "%(filename)s:%(lineno)d | %(funcName)s | %(message)s"
+)
 
 
 def setup_logging(
@@ -155,6 +274,8 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _queue_listener
+
     if config is None:
         config = LoggingConfig()
 
@@ -170,7 +291,8 @@ def setup_logging(
     logger = logging.getLogger("github_repo_analyzer")
     logger.setLevel(level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers (and the file listener from a previous setup)
+    _stop_queue_listener()
     logger.handlers.clear()
 
     # Create formatters (always colored for console)
@@ -179,12 +301,10 @@ def setup_logging(
         datefmt="%H:%M:%S",
     )
 
-    # File formatter (more detailed)
+    # File formatter (adds the call site only when debugging)
+    include_caller = level <= logging.DEBUG
     file_formatter = logging.Formatter(
-        fmt=(
-            "%(asctime)s | %(levelname)-8s | %(name)s | "
-            "%(filename)s:%(lineno)d | %(funcName)s | %(message)s"
-        ),
+        fmt=_FILE_FORMAT_WITH_CALLER if include_caller else _FILE_FORMAT,
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
@@ -210,7 +330,7 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Rotating file handler (10MB max, keep 5 files)
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             actual_log_file,
             maxBytes=10 * 1024 * 1024,
             backupCount=5,
@@ -218,7 +338,15 @@ def setup_logging(
         )
         file_handler.setLevel(logging.DEBUG)  # Always debug level for files
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Queue records so file I/O happens on a background thread instead of
+        # the caller's; the console handler stays direct for live output
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
 
         # Cleanup old log files if using automatic logging
         if not log_file and config.auto_log_file:
@@ -247,6 +375,18 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class _CallParams:
+    """Render keyword arguments as ``k=v`` pairs only when a record is formatted."""
+
+    __slots__ = ("kwargs",)
+
+    def __init__(self, kwargs: Dict[str, Any]) -> None:
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self.kwargs.items() if v is not None)
+
+
 def log_function_call(logger: logging.Logger, func_name: str, **kwargs: Any) -> None:
     """Log function call with parameters.
 
@@ -256,8 +396,7 @@ def log_function_call(logger: logging.Logger, func_name: str, **kwargs: Any) ->
         **kwargs: Function parameters to log
     """
     if logger.isEnabledFor(logging.DEBUG):
-        params = ", ".join(f"{k}={v}" for k, v in kwargs.items() if v is not None)
-        logger.debug("Calling %s(%s)", func_name, params)
+        logger.debug("Calling %s(%s)", func_name, _CallParams(kwargs))
 
 
 def log_performance(logger: logging.Logger, operation: str, duration: float) -> None:
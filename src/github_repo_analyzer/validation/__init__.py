@@ -1,6 +1,9 @@
 """Input validation for GitHub Repository Analyzer."""
 
 from .validation import (
+    AnalyzeInputs,
+    ConfigInputs,
+    SearchInputs,
     ValidationError,
     validate_analyze_inputs,
     validate_cache_dir,
@@ -19,6 +22,9 @@ from .validation import (
 )
 
 __all__ = [
+    "AnalyzeInputs",
+    "ConfigInputs",
+    "SearchInputs",
     "ValidationError",
     "validate_analyze_inputs",
     "validate_cache_dir",
@@ -4,17 +4,55 @@ This module provides centralized validation functions for all user inputs,
 ensuring consistent validation logic across the application.
 """
 
+import logging
 import re
-from typing import Any, Dict, Optional
-
-from github_repo_analyzer.loggers import get_logger
-
-logger = get_logger(__name__)
+import string
+from functools import lru_cache
+from typing import Any, Final, FrozenSet, NamedTuple, Optional, Tuple
+
+# The stdlib logger is used directly (get_logger would return the same one)
+# so importing the validators does not pull in the logging setup module
+logger = logging.getLogger(__name__)
+
+# Allowed characters for usernames/organizations and language names
+_USERNAME_RE = re.compile(r"(?!-)(?!.*--)[A-Za-z0-9_-]{1,39}(?<!-)")
+_USERNAME_BYTES = (string.ascii_letters + string.digits + "-_").encode("ascii")
+_LANGUAGE_RE = re.compile(r"^[a-zA-Z0-9\s\-\+\.\#\/]+$")
+_LANGUAGE_BYTES = (
+    string.ascii_letters
+    + string.digits
+    + "-+.#/"
+    + "".join(c for c in map(chr, range(128)) if c.isspace())
+).encode("ascii")
+
+# Accepted sort fields and output formats, with their error messages
+_VALID_SORT_FIELDS: FrozenSet[str] = frozenset(
+    {"name", "stars", "forks", "updated", "created", "size"}
+)
+_SORT_FIELD_ERROR = (
+    f"Sort field must be one of: {', '.join(sorted(_VALID_SORT_FIELDS))}"
+)
+_VALID_OUTPUT_FORMATS: FrozenSet[str] = frozenset({"table", "json", "summary"})
+_OUTPUT_FORMAT_ERROR = (
+    f"Output format must be one of: {', '.join(sorted(_VALID_OUTPUT_FORMATS))}"
+)
+
+# Default configuration values, which are known to be valid
+_DEFAULT_CACHE_DIR: Final = ".cache"
+_DEFAULT_CACHE_TTL: Final = 3600
+
+# Upper bounds for the numeric validators (Final, so mypyc can inline them)
+_MAX_MIN_STARS: Final = 1000000
+_MAX_MIN_FORKS: Final = 100000
+_MAX_CACHE_TTL: Final = 86400 * 30  # 30 days
 
 
 class ValidationError(ValueError):
     """Custom exception for validation errors."""
 
+    # Keep the field in a slot so instances do not allocate a __dict__
+    __slots__ = ("field",)
+
     def __init__(self, message: str, field: Optional[str] = None) -> None:
         """Initialize validation error.
 
@@ -25,69 +63,161 @@ class ValidationError(ValueError):
         super().__init__(message)
         self.field = field
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Slots are not part of BaseException's pickled state
+        return (type(self), (*self.args, self.field))
 
-def validate_username_or_org(username_or_org: str) -> str:
-    """Validate GitHub username or organization name.
 
-    Args:
-        username_or_org: Username or organization name to validate
+class AnalyzeInputs(NamedTuple):
+    """Validated inputs for the analyze command."""
 
-    Returns:
-        Cleaned username or organization name
+    username_or_org: str
+    limit: Optional[int]
+    sort_field: str
+    output_format: str
 
-    Raises:
-        ValidationError: If validation fails
-    """
-    if not username_or_org:
-        raise ValidationError(
-            "Username or organization name cannot be empty", "username_or_org"
-        )
 
-    # Strip whitespace
-    cleaned = username_or_org.strip()
+class SearchInputs(NamedTuple):
+    """Validated inputs for the search command."""
 
+    username_or_org: str
+    limit: Optional[int]
+    sort_field: str
+    language: Optional[str]
+    min_stars: Optional[int]
+    min_forks: Optional[int]
+    public_only: bool
+    private_only: bool
+
+
+class ConfigInputs(NamedTuple):
+    """Validated configuration inputs."""
+
+    cache_dir: str
+    cache_ttl: int
+    token: Optional[str] = None
+
+
+def _username_error(cleaned: str) -> ValidationError:
+    """Explain why a username or organization name failed validation.
+
+    Only called once the combined pattern has rejected the name, so the
+    individual rules are checked here to pick the most specific message.
+
+    Args:
+        cleaned: Stripped username or organization name
+
+    Returns:
+        ValidationError describing the first rule that is broken
+    """
     if not cleaned:
-        raise ValidationError(
+        return ValidationError(
             "Username or organization name cannot be empty", "username_or_org"
         )
 
-    # GitHub username/org rules:
-    # - Must be 1-39 characters
-    # - Can contain alphanumeric characters, hyphens, and underscores
-    # - Cannot start or end with a hyphen
-    # - Cannot have consecutive hyphens
-
     if len(cleaned) > 39:
-        raise ValidationError(
+        return ValidationError(
             "Username or organization name cannot exceed 39 characters",
             "username_or_org",
         )
 
-    # Allow alphanumeric, hyphens, and underscores
-    if not re.match(r"^[a-zA-Z0-9_-]+$", cleaned):
-        raise ValidationError(
+    # Allow ASCII alphanumeric, hyphens, and underscores: deleting every
+    # allowed byte must leave nothing behind
+    try:
+        encoded = cleaned.encode("ascii")
+    except UnicodeEncodeError:
+        encoded = b"\x00"
+    if encoded.translate(None, _USERNAME_BYTES):
+        return ValidationError(
             "Username or organization name can only contain alphanumeric characters, "
             "hyphens, and underscores",
             "username_or_org",
         )
 
-    # Check for invalid patterns
-    if cleaned.startswith("-") or cleaned.endswith("-"):
-        raise ValidationError(
+    if encoded[0] == 0x2D or encoded[-1] == 0x2D:  # "-"
+        return ValidationError(
             "Username or organization name cannot start or end with hyphens",
             "username_or_org",
         )
 
-    if "--" in cleaned:
-        raise ValidationError(
-            "Username or organization name cannot have consecutive hyphens",
-            "username_or_org",
-        )
+    # The only rule left that the pattern enforces
+    return ValidationError(
+        "Username or organization name cannot have consecutive hyphens",
+        "username_or_org",
+    )
+
+
+@lru_cache(maxsize=256)
+def validate_username_or_org(username_or_org: str) -> str:
+    """Validate GitHub username or organization name.
+
+    Successful results are cached, since the same names are validated
+    repeatedly; invalid names raise and are not cached.
+
+    GitHub username/org rules:
+    - Must be 1-39 characters
+    - Can contain alphanumeric characters, hyphens, and underscores
+    - Cannot start or end with a hyphen
+    - Cannot have consecutive hyphens
+
+    Args:
+        username_or_org: Username or organization name to validate
+
+    Returns:
+        Cleaned username or organization name
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    cleaned = (username_or_org or "").strip()
+
+    # All rules are checked by one pattern (after cheap length and ASCII
+    # checks, so non-ASCII names never reach the regex engine); the slow path
+    # only runs on failure
+    if (
+        len(cleaned) > 39
+        or not cleaned.isascii()
+        or not _USERNAME_RE.fullmatch(cleaned)
+    ):
+        raise _username_error(cleaned)
 
-    logger.debug("Validated username/org: %s", cleaned)
     return cleaned
 
 
+def _validate_int_range(
+    value: int,
+    field_name: str,
+    minimum: int,
+    below_message: str,
+    maximum: Optional[int] = None,
+    above_message: str = "",
+) -> int:
+    """Check that an integer lies within inclusive bounds.
+
+    Args:
+        value: Integer to validate
+        field_name: Name of the field for error messages
+        minimum: Smallest accepted value
+        below_message: Error message when value is below minimum; may
+            contain ``{field_name}``, which is only filled in on failure
+        maximum: Largest accepted value, or None for no upper bound
+        above_message: Error message when value is above maximum
+
+    Returns:
+        The unchanged value
+
+    Raises:
+        ValidationError: If value is out of range
+    """
+    if value < minimum:
+        raise ValidationError(below_message.format(field_name=field_name), field_name)
+
+    if maximum is not None and value > maximum:
+        raise ValidationError(above_message.format(field_name=field_name), field_name)
+
+    return value
+
+
 def validate_limit(limit: Optional[int], field_name: str = "limit") -> Optional[int]:
     """Validate limit parameter.
 
@@ -104,13 +234,9 @@ def validate_limit(limit: Optional[int], field_name: str = "limit") -> Optional[
     if limit is None:
         return None
 
-    if limit < -1:
-        raise ValidationError(
-            f"{field_name} must be -1 (unlimited) or non-negative", field_name
-        )
-
-    logger.debug("Validated %s: %s", field_name, limit)
-    return limit
+    return _validate_int_range(
+        limit, field_name, -1, "{field_name} must be -1 (unlimited) or non-negative"
+    )
 
 
 def validate_visibility_flags(public_only: bool, private_only: bool) -> None:
@@ -129,30 +255,24 @@ def validate_visibility_flags(public_only: bool, private_only: bool) -> None:
             "visibility_flags",
         )
 
-    logger.debug(
-        "Validated visibility flags: public_only=%s, private_only=%s",
-        public_only,
-        private_only,
-    )
 
+@lru_cache(maxsize=128)
+def _normalize_language(language: str) -> Optional[str]:
+    """Strip, validate and title-case a language name.
 
-def validate_language(language: Optional[str]) -> Optional[str]:
-    """Validate programming language filter.
+    Results are cached because the same few language names are validated
+    over and over. Invalid names raise and are not cached.
 
     Args:
-        language: Programming language to validate
+        language: Programming language to normalize
 
     Returns:
-        Cleaned language name
+        Cleaned language name, or None if it is blank
 
     Raises:
         ValidationError: If validation fails
     """
-    if not language:
-        return None
-
-    # Strip whitespace and normalize case
-    cleaned = language.strip().title()
+    cleaned = language.strip()
 
     if not cleaned:
         return None
@@ -163,14 +283,38 @@ def validate_language(language: Optional[str]) -> Optional[str]:
             "Programming language name cannot exceed 50 characters", "language"
         )
 
-    # Allow alphanumeric, spaces, and common punctuation including forward slash
-    if not re.match(r"^[a-zA-Z0-9\s\-\+\.\#\/]+$", cleaned):
+    # Allow alphanumeric, whitespace, and common punctuation including forward
+    # slash. ASCII names are checked by deleting every allowed byte; only
+    # non-ASCII names (which may contain Unicode whitespace) need the regex.
+    if cleaned.isascii():
+        valid = not cleaned.encode("ascii").translate(None, _LANGUAGE_BYTES)
+    else:
+        valid = _LANGUAGE_RE.match(cleaned) is not None
+    if not valid:
         raise ValidationError(
             "Programming language name contains invalid characters", "language"
         )
 
-    logger.debug("Validated language: %s", cleaned)
-    return cleaned
+    # Normalize case only once the name is known to be valid
+    return cleaned.title()
+
+
+def validate_language(language: Optional[str]) -> Optional[str]:
+    """Validate programming language filter.
+
+    Args:
+        language: Programming language to validate
+
+    Returns:
+        Cleaned language name
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if not language:
+        return None
+
+    return _normalize_language(language)
 
 
 def validate_min_stars(min_stars: Optional[int]) -> Optional[int]:
@@ -188,14 +332,14 @@ def validate_min_stars(min_stars: Optional[int]) -> Optional[int]:
     if min_stars is None:
         return None
 
-    if min_stars < 0:
-        raise ValidationError("Minimum stars must be non-negative", "min_stars")
-
-    if min_stars > 1000000:  # Reasonable upper limit
-        raise ValidationError("Minimum stars cannot exceed 1,000,000", "min_stars")
-
-    logger.debug("Validated min_stars: %s", min_stars)
-    return min_stars
+    return _validate_int_range(
+        min_stars,
+        "min_stars",
+        0,
+        "Minimum stars must be non-negative",
+        _MAX_MIN_STARS,
+        "Minimum stars cannot exceed 1,000,000",
+    )
 
 
 def validate_min_forks(min_forks: Optional[int]) -> Optional[int]:
@@ -213,14 +357,14 @@ def validate_min_forks(min_forks: Optional[int]) -> Optional[int]:
     if min_forks is None:
         return None
 
-    if min_forks < 0:
-        raise ValidationError("Minimum forks must be non-negative", "min_forks")
-
-    if min_forks > 100000:  # Reasonable upper limit
-        raise ValidationError("Minimum forks cannot exceed 100,000", "min_forks")
-
-    logger.debug("Validated min_forks: %s", min_forks)
-    return min_forks
+    return _validate_int_range(
+        min_forks,
+        "min_forks",
+        0,
+        "Minimum forks must be non-negative",
+        _MAX_MIN_FORKS,
+        "Minimum forks cannot exceed 100,000",
+    )
 
 
 def validate_sort_field(sort_field: str) -> str:
@@ -235,15 +379,9 @@ def validate_sort_field(sort_field: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    valid_fields = {"name", "stars", "forks", "updated", "created", "size"}
-
-    if sort_field not in valid_fields:
-        raise ValidationError(
-            f"Sort field must be one of: {', '.join(sorted(valid_fields))}",
-            "sort_field",
-        )
+    if sort_field not in _VALID_SORT_FIELDS:
+        raise ValidationError(_SORT_FIELD_ERROR, "sort_field")
 
-    logger.debug("Validated sort_field: %s", sort_field)
     return sort_field
 
 
@@ -259,15 +397,9 @@ def validate_output_format(output_format: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    valid_formats = {"table", "json", "summary"}
-
-    if output_format not in valid_formats:
-        raise ValidationError(
-            f"Output format must be one of: {', '.join(sorted(valid_formats))}",
-            "output_format",
-        )
+    if output_format not in _VALID_OUTPUT_FORMATS:
+        raise ValidationError(_OUTPUT_FORMAT_ERROR, "output_format")
 
-    logger.debug("Validated output_format: %s", output_format)
     return output_format
 
 
@@ -283,16 +415,14 @@ def validate_cache_ttl(cache_ttl: int) -> int:
     Raises:
         ValidationError: If validation fails
     """
-    if cache_ttl < 0:
-        raise ValidationError("Cache TTL must be non-negative", "cache_ttl")
-
-    if cache_ttl > 86400 * 30:  # 30 days max
-        raise ValidationError(
-            "Cache TTL cannot exceed 30 days (2,592,000 seconds)", "cache_ttl"
-        )
-
-    logger.debug("Validated cache_ttl: %s", cache_ttl)
-    return cache_ttl
+    return _validate_int_range(
+        cache_ttl,
+        "cache_ttl",
+        0,
+        "Cache TTL must be non-negative",
+        _MAX_CACHE_TTL,
+        "Cache TTL cannot exceed 30 days (2,592,000 seconds)",
+    )
 
 
 def validate_cache_dir(cache_dir: str) -> str:
@@ -307,10 +437,7 @@ def validate_cache_dir(cache_dir: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    if not cache_dir:
-        raise ValidationError("Cache directory cannot be empty", "cache_dir")
-
-    cleaned = cache_dir.strip()
+    cleaned = (cache_dir or "").strip()
 
     if not cleaned:
         raise ValidationError("Cache directory cannot be empty", "cache_dir")
@@ -321,7 +448,6 @@ def validate_cache_dir(cache_dir: str) -> str:
             "Cache directory path cannot exceed 500 characters", "cache_dir"
         )
 
-    logger.debug("Validated cache_dir: %s", cleaned)
     return cleaned
 
 
@@ -337,10 +463,7 @@ def validate_github_token(token: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    if not token:
-        raise ValidationError("GitHub token cannot be empty", "github_token")
-
-    cleaned = token.strip()
+    cleaned = (token or "").strip()
 
     if not cleaned:
         raise ValidationError("GitHub token cannot be empty", "github_token")
@@ -353,7 +476,6 @@ def validate_github_token(token: str) -> str:
     if len(cleaned) > 200:  # Reasonable upper limit
         raise ValidationError("GitHub token appears to be too long", "github_token")
 
-    logger.debug("Validated GitHub token (length: %d)", len(cleaned))
     return cleaned
 
 
@@ -362,7 +484,7 @@ def validate_analyze_inputs(
     limit: Optional[int] = None,
     sort_field: str = "updated",
     output_format: str = "table",
-) -> Dict[str, Any]:
+) -> AnalyzeInputs:
     """Validate all inputs for the analyze command.
 
     Args:
@@ -372,19 +494,19 @@ def validate_analyze_inputs(
         output_format: Output format
 
     Returns:
-        Dictionary of validated inputs
+        Validated analyze inputs
 
     Raises:
         ValidationError: If any validation fails
     """
     logger.debug("Validating analyze command inputs")
 
-    validated = {
-        "username_or_org": validate_username_or_org(username_or_org),
-        "limit": validate_limit(limit),
-        "sort_field": validate_sort_field(sort_field),
-        "output_format": validate_output_format(output_format),
-    }
+    validated = AnalyzeInputs(
+        username_or_org=validate_username_or_org(username_or_org),
+        limit=validate_limit(limit),
+        sort_field=validate_sort_field(sort_field),
+        output_format=validate_output_format(output_format),
+    )
 
     logger.debug("All analyze inputs validated successfully")
     return validated
@@ -399,7 +521,7 @@ def validate_search_inputs(
     min_forks: Optional[int] = None,
     public_only: bool = False,
     private_only: bool = False,
-) -> Dict[str, Any]:
+) -> SearchInputs:
     """Validate all inputs for the search command.
 
     Args:
@@ -413,26 +535,28 @@ def validate_search_inputs(
         private_only: Private only flag
 
     Returns:
-        Dictionary of validated inputs
+        Validated search inputs
 
     Raises:
         ValidationError: If any validation fails
     """
     logger.debug("Validating search command inputs")
 
-    # Validate visibility flags first
-    validate_visibility_flags(public_only, private_only)
-
-    validated = {
-        "username_or_org": validate_username_or_org(username_or_org),
-        "limit": validate_limit(limit),
-        "sort_field": validate_sort_field(sort_field),
-        "language": validate_language(language),
-        "min_stars": validate_min_stars(min_stars),
-        "min_forks": validate_min_forks(min_forks),
-        "public_only": public_only,
-        "private_only": private_only,
-    }
+    # Validate visibility flags first; the call (which raises) is only made
+    # when both are set, so the common case skips it
+    if public_only and private_only:
+        validate_visibility_flags(public_only, private_only)
+
+    validated = SearchInputs(
+        username_or_org=validate_username_or_org(username_or_org),
+        limit=validate_limit(limit),
+        sort_field=validate_sort_field(sort_field),
+        language=validate_language(language),
+        min_stars=validate_min_stars(min_stars),
+        min_forks=validate_min_forks(min_forks),
+        public_only=public_only,
+        private_only=private_only,
+    )
 
     logger.debug("All search inputs validated successfully")
     return validated
@@ -440,9 +564,9 @@ def validate_search_inputs(
 
 def validate_config_inputs(
     token: Optional[str] = None,
-    cache_dir: str = ".cache",
-    cache_ttl: int = 3600,
-) -> Dict[str, Any]:
+    cache_dir: str = _DEFAULT_CACHE_DIR,
+    cache_ttl: int = _DEFAULT_CACHE_TTL,
+) -> ConfigInputs:
     """Validate configuration inputs.
 
     Args:
@@ -451,20 +575,27 @@ def validate_config_inputs(
         cache_ttl: Cache TTL in seconds
 
     Returns:
-        Dictionary of validated inputs
+        Validated configuration inputs (token is None when not provided)
 
     Raises:
         ValidationError: If any validation fails
     """
     logger.debug("Validating configuration inputs")
 
-    validated = {
-        "cache_dir": validate_cache_dir(cache_dir),
-        "cache_ttl": validate_cache_ttl(cache_ttl),
-    }
-
-    if token:
-        validated["token"] = validate_github_token(token)
+    # The defaults are valid by construction, so skip re-checking them
+    validated = ConfigInputs(
+        cache_dir=(
+            cache_dir
+            if cache_dir == _DEFAULT_CACHE_DIR
+            else validate_cache_dir(cache_dir)
+        ),
+        cache_ttl=(
+            cache_ttl
+            if cache_ttl == _DEFAULT_CACHE_TTL
+            else validate_cache_ttl(cache_ttl)
+        ),
+        token=validate_github_token(token) if token else None,
+    )
 
     logger.debug("Configuration inputs validated successfully")
     return validated
@@ -0,0 +1,44 @@
+"""Shared pytest configuration."""
+
+import subprocess
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --run-slow option."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked slow (e.g. ones that spawn subprocesses)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow was given."""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test - pass --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def help_outputs():
+    """Run the installed entry point's --help once per command and cache it."""
+    cache = {}
+
+    def get(*command):
+        if command not in cache:
+            cache[command] = subprocess.run(
+                ["github-repo-analyzer", *command, "--help"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        return cache[command]
+
+    return get
@@ -1,11 +1,51 @@
 """Tests for the GitHub API client."""
 
+import json
 from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from github import Github
+from github.GithubException import GithubException, RateLimitExceededException
+from github.Repository import Repository as GHRepository
 
 from github_repo_analyzer.core import GitHubAPI, Owner, Repository
+from github_repo_analyzer.core.models import (
+    _PYGITHUB_DATETIME_FIELDS,
+    _PYGITHUB_FIELDS,
+)
+
+
+def _make_mock_repo(name: str, language: str = "Python") -> Mock:
+    """Build a mock PyGithub repository with the attributes we read."""
+    mock_repo = Mock()
+    mock_repo.name = name
+    mock_repo.full_name = f"user/{name}"
+    mock_repo.description = f"{name} repository"
+    mock_repo.html_url = f"https://github.com/user/{name}"
+    mock_repo.clone_url = f"https://github.com/user/{name}.git"
+    mock_repo.ssh_url = f"git@github.com:user/{name}.git"
+    mock_repo.language = language
+    mock_repo.stargazers_count = 1
+    mock_repo.forks_count = 1
+    mock_repo.open_issues_count = 0
+    mock_repo.size = 100
+    mock_repo.created_at = datetime(2023, 1, 1, 0, 0, 0)
+    mock_repo.updated_at = datetime(2023, 1, 2, 0, 0, 0)
+    mock_repo.pushed_at = datetime(2023, 1, 2, 0, 0, 0)
+    mock_repo.private = False
+    mock_repo.archived = False
+    mock_repo.disabled = False
+    mock_repo.owner = Mock()
+    mock_repo.owner.login = "user"
+    mock_repo.owner.id = 12345
+    mock_repo.owner.type = "User"
+    mock_repo.owner.html_url = "https://github.com/user"
+    mock_repo.owner.avatar_url = "https://avatars.githubusercontent.com/u/12345?v=4"
+    return mock_repo
 
 
 class TestGitHubAPI:
@@ -25,14 +65,14 @@ class TestGitHubAPI:
         assert api.token == "test_token"
         assert api.github is not None
 
-    def test_init_without_token(self):
+    def test_init_without_token(self, monkeypatch):
         """Test initialization without token raises ValueError."""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(ValueError, match="GitHub token is required"):
-                GitHubAPI()
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with pytest.raises(ValueError, match="GitHub token is required"):
+            GitHubAPI()
 
     @patch("github_repo_analyzer.core.api.Github")
-    def test_init_with_env_token(self, mock_github_class):
+    def test_init_with_env_token(self, mock_github_class, monkeypatch):
         """Test initialization with token from environment."""
         # Mock the connection test
         mock_github = Mock()
@@ -41,9 +81,9 @@ class TestGitHubAPI:
         mock_github.get_user.return_value = mock_user
         mock_github_class.return_value = mock_github
 
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "env_token"}):
-            api = GitHubAPI()
-            assert api.token == "env_token"
+        monkeypatch.setenv("GITHUB_TOKEN", "env_token")
+        api = GitHubAPI()
+        assert api.token == "env_token"
 
     @patch("github_repo_analyzer.core.api.Github")
     def test_get_user_repos_success(self, mock_github_class):
@@ -93,6 +133,28 @@ class TestGitHubAPI:
         assert repos[0].name == "test-repo"
         assert repos[0].language == "Python"
 
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_init_does_not_call_api(self, mock_github_class):
+        """Test that construction does not probe the API by default."""
+        mock_github = Mock()
+        mock_github_class.return_value = mock_github
+
+        GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+
+        mock_github.get_user.assert_not_called()
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_init_with_verify_auth(self, mock_github_class):
+        """Test that verify_auth performs the authentication probe."""
+        from github.GithubException import GithubException
+
+        mock_github = Mock()
+        mock_github.get_user.side_effect = GithubException(401, "Bad credentials")
+        mock_github_class.return_value = mock_github
+
+        with pytest.raises(ValueError, match="Invalid GitHub token"):
+            GitHubAPI("test_token", cache_dir=None, verify_auth=True)
+
     @patch("github_repo_analyzer.core.api.Github")
     def test_get_user_repos_error(self, mock_github_class):
         """Test user repos retrieval with error."""
@@ -102,8 +164,50 @@ class TestGitHubAPI:
         mock_github.get_user.side_effect = GithubException(500, "API Error")
         mock_github_class.return_value = mock_github
 
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
         with pytest.raises(ValueError, match="GitHub API error"):
-            GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+            api.get_user_repos("testuser")
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_rate_limit_retries_exhausted(self, mock_github_class):
+        """Test that exhausted 403 retries are reported as a rate limit."""
+        mock_github = Mock()
+        mock_github.get_user.side_effect = requests.exceptions.RetryError(
+            "Max retries exceeded (Caused by ResponseError("
+            "'too many 403 error responses'))"
+        )
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        with pytest.raises(ValueError, match="rate limit exceeded"):
+            api.get_all_repos("testuser")
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_server_retries_exhausted(self, mock_github_class):
+        """Test that exhausted server error retries are not called a rate limit."""
+        mock_github = Mock()
+        mock_github.get_user.side_effect = requests.exceptions.RetryError(
+            "Max retries exceeded (Caused by ResponseError("
+            "'too many 502 error responses'))"
+        )
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        with pytest.raises(ValueError, match="kept failing") as exc_info:
+            api.get_all_repos("testuser")
+        assert "rate limit" not in str(exc_info.value)
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_verify_auth_rate_limit_exceeded(self, mock_github_class):
+        """Test that a rate-limited token check is not reported as forbidden."""
+        mock_github = Mock()
+        mock_github.get_user.side_effect = RateLimitExceededException(
+            403, {"message": "API rate limit exceeded"}, None
+        )
+        mock_github_class.return_value = mock_github
+
+        with pytest.raises(ValueError, match="rate limit exceeded"):
+            GitHubAPI("test_token", cache_dir=None, verify_auth=True)
 
     @patch("github_repo_analyzer.core.api.Github")
     def test_get_org_repos_success(self, mock_github_class):
@@ -153,6 +257,185 @@ class TestGitHubAPI:
         assert repos[0].name == "org-repo"
         assert repos[0].language == "JavaScript"
 
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_stops_at_limit(self, mock_github_class):
+        """Test that get_all_repos stops consuming repositories at the limit."""
+        mock_github = Mock()
+        mock_user = Mock()
+        consumed = []
+
+        def _repos():
+            for i in range(10):
+                consumed.append(i)
+                yield _make_mock_repo(f"repo-{i}")
+
+        mock_user.get_repos.return_value = _repos()
+        mock_github.get_user.return_value = mock_user
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        repos = api.get_all_repos("testuser", limit=3)
+
+        assert [r.name for r in repos] == ["repo-0", "repo-1", "repo-2"]
+        assert consumed == [0, 1, 2]
+        assert mock_github_class.call_args.kwargs["per_page"] == 100
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_negative_limit(self, mock_github_class):
+        """Test that a negative limit returns no repositories instead of failing."""
+        mock_github = Mock()
+        mock_github.get_user.return_value.get_repos.return_value = iter(
+            [_make_mock_repo("repo")]
+        )
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+
+        assert api.get_all_repos("testuser", limit=-5) == []
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_uses_cache(self, mock_github_class):
+        """Test that repeated listings are served from the in-process cache."""
+        mock_github = Mock()
+        mock_user = Mock()
+        mock_user.get_repos.side_effect = lambda **kwargs: [_make_mock_repo("repo")]
+        mock_github.get_user.return_value = mock_user
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=".cache", cache_ttl=60)
+        first = api.get_all_repos("testuser", limit=10)
+        second = api.get_all_repos("testuser", limit=10)
+
+        assert [r.name for r in first] == [r.name for r in second]
+        assert mock_user.get_repos.call_count == 1
+
+        api.invalidate("testuser")
+        api.get_all_repos("testuser", limit=10)
+        assert mock_user.get_repos.call_count == 2
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_get_all_repos_cache_disabled(self, mock_github_class):
+        """Test that disabling the cache always fetches repositories."""
+        mock_github = Mock()
+        mock_user = Mock()
+        mock_user.get_repos.side_effect = lambda **kwargs: [_make_mock_repo("repo")]
+        mock_github.get_user.return_value = mock_user
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        api.get_all_repos("testuser", limit=10)
+        api.get_all_repos("testuser", limit=10)
+
+        assert mock_user.get_repos.call_count == 2
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_search_repos_builds_query(self, mock_github_class):
+        """Test that search filters are translated into search qualifiers."""
+        mock_github = Mock()
+        mock_github.search_repositories.return_value = [_make_mock_repo("match")]
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        repos = api.search_repos(
+            "testorg",
+            is_organization=True,
+            language="Jupyter Notebook",
+            min_stars=10,
+            min_forks=2,
+            sort="stars",
+            limit=5,
+        )
+
+        assert [r.name for r in repos] == ["match"]
+        mock_github.search_repositories.assert_called_once_with(
+            'org:testorg fork:true language:"Jupyter Notebook" stars:>=10 forks:>=2',
+            sort="stars",
+            order="desc",
+        )
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_search_repos_skips_zero_thresholds(self, mock_github_class):
+        """Test that zero thresholds are left out of the search query."""
+        mock_github = Mock()
+        mock_github.search_repositories.return_value = []
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        api.search_repos("testuser", language="Python", min_stars=0, min_forks=0)
+
+        mock_github.search_repositories.assert_called_once_with(
+            "user:testuser fork:true language:Python"
+        )
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_search_repos_unknown_user_is_not_found(self, mock_github_class):
+        """Test that the search 422 for an unknown account reads as not found."""
+        mock_github = Mock()
+        mock_github.search_repositories.side_effect = GithubException(
+            422,
+            {
+                "message": "Validation Failed",
+                "errors": [
+                    {
+                        "message": "The listed users and repositories cannot be "
+                        "searched either because the resources do not exist or you "
+                        "do not have permission to view them.",
+                        "resource": "Search",
+                        "field": "q",
+                        "code": "invalid",
+                    }
+                ],
+            },
+            None,
+        )
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        with pytest.raises(ValueError, match="user or organization not found"):
+            api.search_repos("nobody", language="Python")
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_search_repos_invalid_query_is_not_not_found(self, mock_github_class):
+        """Test that other 422 search errors are reported as invalid requests."""
+        mock_github = Mock()
+        mock_github.search_repositories.side_effect = GithubException(
+            422,
+            {
+                "message": "Validation Failed",
+                "errors": [
+                    {
+                        "message": "The search is longer than 256 characters.",
+                        "resource": "Search",
+                        "field": "q",
+                        "code": "invalid",
+                    }
+                ],
+            },
+            None,
+        )
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=None)  # Disable caching for test
+        with pytest.raises(ValueError, match="Invalid request") as exc_info:
+            api.search_repos("testuser", language="Python")
+        assert "not found" not in str(exc_info.value)
+
+    @patch("github_repo_analyzer.core.api.Github")
+    def test_search_repos_uses_cache(self, mock_github_class):
+        """Test that repeated searches are served from the in-process cache."""
+        mock_github = Mock()
+        mock_github.search_repositories.side_effect = lambda *a, **k: [
+            _make_mock_repo("match")
+        ]
+        mock_github_class.return_value = mock_github
+
+        api = GitHubAPI("test_token", cache_dir=".cache", cache_ttl=60)
+        api.search_repos("testuser", language="Python")
+        api.search_repos("testuser", language="Python")
+        api.search_repos("testuser", language="Go")
+
+        assert mock_github.search_repositories.call_count == 2
+
 
 class TestRepository:
     """Test cases for Repository model."""
@@ -201,6 +484,112 @@ class TestRepository:
         assert repo.archived is False
         assert "python" in repo.topics
 
+    def test_from_pygithub(self):
+        """Test building a Repository from a PyGithub object."""
+        repo = Repository.from_pygithub(_make_mock_repo("test-repo"))
+
+        assert repo.name == "test-repo"
+        assert repo.created_at == "2023-01-01T00:00:00"
+        assert repo.updated_at_date == "2023-01-02"
+        assert isinstance(repo.owner, Owner)
+        assert repo.owner.login == "user"
+        assert repo.topics == []
+        assert repo.to_dict()["owner"]["id"] == 12345
+
+    def test_from_pygithub_uses_raw_payload(self):
+        """Test that fields are read from the PyGithub JSON payload."""
+        raw = {
+            "name": "raw-repo",
+            "full_name": "user/raw-repo",
+            "description": None,
+            "html_url": "https://github.com/user/raw-repo",
+            "clone_url": "https://github.com/user/raw-repo.git",
+            "ssh_url": "git@github.com:user/raw-repo.git",
+            "language": "Go",
+            "stargazers_count": 3,
+            "forks_count": 2,
+            "open_issues_count": 1,
+            "size": 512,
+            "private": True,
+            "archived": False,
+            "disabled": False,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-02-03T04:05:06Z",
+            "pushed_at": None,
+            "owner": {
+                "login": "user",
+                "id": 12345,
+                "type": "User",
+                "html_url": "https://github.com/user",
+                "avatar_url": "https://avatars.githubusercontent.com/u/12345?v=4",
+            },
+        }
+        # No attributes besides the payload, so any attribute fallback would fail
+        repo = Repository.from_pygithub(SimpleNamespace(_rawData=raw))
+
+        assert repo.name == "raw-repo"
+        assert repo.private is True
+        assert repo.updated_at_date == "2023-02-03"
+        assert repo.updated_at == "2023-02-03T04:05:06+00:00"
+        assert repo.owner.login == "user"
+
+    def test_from_pygithub_payload_matches_attributes(self):
+        """Test that the payload and attribute paths produce the same model."""
+        payload = json.loads(
+            (Path(__file__).parent / "fixtures" / "octocat_repos.json").read_text(
+                encoding="utf-8"
+            )
+        )[0]
+        gh_repo = Github().create_from_raw_data(GHRepository, payload)
+        # The same values without the payload, so only attributes are read
+        attributes = SimpleNamespace(
+            **{
+                field: getattr(gh_repo, field)
+                for field in (*_PYGITHUB_FIELDS, *_PYGITHUB_DATETIME_FIELDS, "owner")
+            }
+        )
+
+        from_payload = Repository.from_pygithub(gh_repo)
+        from_attributes = Repository.from_pygithub(attributes)
+
+        assert from_payload.model_dump() == from_attributes.model_dump()
+        assert from_payload.created_at == "2011-01-26T19:01:12+00:00"
+
+    def test_from_pygithub_merges_partial_payload(self):
+        """Test that fields missing from the payload come from attributes."""
+        source = _make_mock_repo("test-repo")
+        partial = SimpleNamespace(
+            _rawData={"name": "from-payload"},
+            **{
+                field: getattr(source, field)
+                for field in (
+                    "full_name",
+                    "description",
+                    "html_url",
+                    "clone_url",
+                    "ssh_url",
+                    "language",
+                    "stargazers_count",
+                    "forks_count",
+                    "open_issues_count",
+                    "size",
+                    "private",
+                    "archived",
+                    "disabled",
+                    "created_at",
+                    "updated_at",
+                    "pushed_at",
+                    "owner",
+                )
+            },
+        )
+
+        repo = Repository.from_pygithub(partial)
+
+        assert repo.name == "from-payload"
+        assert repo.full_name == "user/test-repo"
+        assert repo.created_at == "2023-01-01T00:00:00"
+
     def test_repository_to_dict(self):
         """Test Repository to_dict method."""
         repo = Repository(
@@ -238,3 +627,5 @@ class TestRepository:
         assert repo_dict["language"] == "Python"
         assert repo_dict["stargazers_count"] == 10
         assert repo_dict["private"] is False
+        assert "updated_at_date" not in repo_dict
+        assert repo.updated_at_date == "2023-01-02"
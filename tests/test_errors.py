@@ -1,7 +1,10 @@
 """Tests for centralized error handling system."""
 
-from unittest.mock import MagicMock
+import logging
+from dataclasses import dataclass, replace
+from unittest.mock import create_autospec
 
+import pytest
 import requests.exceptions
 
 from github_repo_analyzer.errors import (
@@ -20,12 +23,39 @@ from github_repo_analyzer.errors import (
     convert_network_exception,
     convert_value_error,
     create_legacy_validation_error,
+    error_handler,
     format_error_message,
     get_error_tip,
     handle_error,
+    log_error_with_context,
 )
 
 
+@dataclass(eq=False)
+class FakeGHException(Exception):
+    """Stand-in for a GitHub exception: a status code and a message."""
+
+    status: int
+    message: str = ""
+
+    def __str__(self):
+        return self.message
+
+
+# Shared fake GitHub exceptions; the handlers only read them
+GH_EXC_401 = FakeGHException(401)
+GH_EXC_403_RL = FakeGHException(403, "rate limit exceeded")
+GH_EXC_404 = FakeGHException(404)
+GH_EXC_429 = FakeGHException(429)
+GH_EXC_500 = FakeGHException(500)
+
+
+@pytest.fixture(scope="session")
+def handler():
+    """Share one ErrorHandler; it holds nothing but its logger."""
+    return ErrorHandler()
+
+
 class TestErrorContext:
     """Test cases for ErrorContext class."""
 
@@ -94,6 +124,33 @@ class TestCustomExceptions:
         assert error.message == "Test message"
         assert error.context == context
 
+    def test_cause_is_exception_chain(self):
+        """Test that the cause is stored as the standard exception chain."""
+        original = ValueError("Original error")
+        error = GitHubRepoAnalyzerError("Wrapped", cause=original)
+
+        assert error.cause is original
+        assert error.__cause__ is original
+        assert GitHubRepoAnalyzerError("No cause").cause is None
+
+    def test_error_without_context_gets_its_own_context(self):
+        """Test that context-less errors get independent, mutable contexts."""
+        first = AuthenticationError("Invalid token")
+        second = NotFoundError("Missing")
+
+        assert first.context is not second.context
+        assert first.context == ErrorContext()
+        assert repr(first.context).startswith("ErrorContext(")
+
+        first.context.add_info("key", "value")
+        assert first.context.additional_info == {"key": "value"}
+        assert second.context.additional_info is None
+
+    def test_error_without_context_supports_replace(self):
+        """Test that dataclasses.replace works on a default context."""
+        context = replace(AuthenticationError("x").context, operation="o")
+        assert context == ErrorContext(operation="o")
+
     def test_authentication_error(self):
         """Test AuthenticationError."""
         error = AuthenticationError("Invalid token")
@@ -112,6 +169,16 @@ class TestCustomExceptions:
         error = ValidationError("Invalid value", field="username")
         assert error.context.field == "username"
 
+    def test_validation_error_updates_given_context(self):
+        """Test ValidationError fills field and value into a provided context."""
+        context = ErrorContext(operation="validation")
+        error = ValidationError(
+            "Invalid value", field="limit", value=-5, context=context
+        )
+        assert error.context is context
+        assert context.field == "limit"
+        assert context.value == -5
+
     def test_api_error_with_status_code(self):
         """Test APIError with status code."""
         context = ErrorContext(status_code=500)
@@ -122,43 +189,39 @@ class TestCustomExceptions:
 class TestErrorHandler:
     """Test cases for ErrorHandler class."""
 
-    def test_handle_github_exception_401(self):
+    def test_handle_github_exception_401(self, handler):
         """Test handling 401 GitHub exception."""
-        handler = ErrorHandler()
-        exception = MagicMock()
-        exception.status = 401
-
-        result = handler.handle_github_exception(exception, "test_operation")
+        result = handler.handle_github_exception(GH_EXC_401, "test_operation")
 
         assert isinstance(result, AuthenticationError)
         assert "Invalid GitHub token" in result.message
 
-    def test_handle_github_exception_403_rate_limit(self):
+    def test_handle_github_exception_403_rate_limit(self, handler):
         """Test handling 403 rate limit exception."""
-        handler = ErrorHandler()
-        exception = MagicMock()
-        exception.status = 403
-        exception.__str__ = MagicMock(return_value="rate limit exceeded")
-
-        result = handler.handle_github_exception(exception, "test_operation")
+        result = handler.handle_github_exception(GH_EXC_403_RL, "test_operation")
 
         assert isinstance(result, RateLimitError)
         assert "rate limit exceeded" in result.message
 
-    def test_handle_github_exception_404(self):
+    def test_handle_github_exception_404(self, handler):
         """Test handling 404 GitHub exception."""
-        handler = ErrorHandler()
-        exception = MagicMock()
-        exception.status = 404
-
-        result = handler.handle_github_exception(exception, "test_operation")
+        result = handler.handle_github_exception(GH_EXC_404, "test_operation")
 
         assert isinstance(result, NotFoundError)
         assert "not found" in result.message
 
-    def test_handle_network_exception_timeout(self):
+    def test_handle_github_exception_unmapped_status(self, handler):
+        """Test that 429 maps to rate limit and unknown statuses to APIError."""
+        assert isinstance(
+            handler.handle_github_exception(GH_EXC_429, "test_operation"),
+            RateLimitError,
+        )
+        result = handler.handle_github_exception(GH_EXC_500, "test_operation")
+        assert isinstance(result, APIError)
+        assert result.context.status_code == 500
+
+    def test_handle_network_exception_timeout(self, handler):
         """Test handling network timeout exception."""
-        handler = ErrorHandler()
         exception = Exception("timeout occurred")
 
         result = handler.handle_network_exception(exception, "test_operation")
@@ -166,9 +229,8 @@ class TestErrorHandler:
         assert isinstance(result, NetworkError)
         assert "timeout" in result.message
 
-    def test_handle_validation_exception(self):
+    def test_handle_validation_exception(self, handler):
         """Test handling validation exception."""
-        handler = ErrorHandler()
         exception = ValueError("Invalid input")
 
         result = handler.handle_validation_exception(
@@ -197,6 +259,13 @@ class TestErrorHandlingFunctions:
 
         assert isinstance(result, ValidationError)
 
+    def test_handle_error_network_text(self):
+        """Test handle_error detects network failures from the message."""
+        result = handle_error(RuntimeError("Connection reset by peer"), "fetch")
+
+        assert isinstance(result, NetworkError)
+        assert "Connection error during fetch" in result.message
+
     def test_format_error_message_authentication(self):
         """Test formatting authentication error message."""
         error = AuthenticationError("Invalid token")
@@ -211,6 +280,17 @@ class TestErrorHandlingFunctions:
 
         assert result == "Validation Error (username): Invalid value"
 
+    def test_format_error_message_uses_class_label(self):
+        """Test that each error type formats with its label."""
+        assert format_error_message(NotFoundError("Missing")) == (
+            "Not Found Error: Missing"
+        )
+        assert format_error_message(GitHubRepoAnalyzerError("Boom")) == "Error: Boom"
+
+    def test_get_error_tip_base_error(self):
+        """Test that the base error has no tip."""
+        assert get_error_tip(GitHubRepoAnalyzerError("Boom")) is None
+
     def test_get_error_tip_authentication(self):
         """Test getting tip for authentication error."""
         error = AuthenticationError("Invalid token")
@@ -233,16 +313,70 @@ class TestErrorHandlingFunctions:
 
         assert "username" in tip
 
+    def test_error_handler_converts_and_chains(self):
+        """Test that the decorator converts errors and chains the cause."""
+
+        @error_handler("test_operation")
+        def fail():
+            raise ValueError("Invalid input")
+
+        with pytest.raises(ValidationError) as exc_info:
+            fail()
+
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
+    def test_error_handler_propagates_custom_errors(self):
+        """Test that already-converted errors propagate unchanged."""
+        original = NotFoundError("Missing")
+
+        @error_handler("test_operation")
+        def fail():
+            raise original
+
+        with pytest.raises(NotFoundError) as exc_info:
+            fail()
+
+        assert exc_info.value is original
+
+    def test_error_handler_without_reraise(self):
+        """Test that the decorator can return the converted error."""
+
+        @error_handler("test_operation", reraise=False)
+        def fail():
+            raise ValueError("Invalid input")
+
+        assert isinstance(fail(), ValidationError)
+
+    def test_log_error_with_context_skips_debug_work(self):
+        """Test that context is not built when debug logging is disabled."""
+        logger = create_autospec(logging.Logger, spec_set=True, instance=True)
+        logger.isEnabledFor.return_value = False
+        context = create_autospec(ErrorContext, spec_set=True, instance=True)
+        error = NotFoundError("Missing", context=context)
+
+        log_error_with_context(logger, error, "test_operation")
+
+        logger.error.assert_called_once()
+        logger.debug.assert_not_called()
+        error.context.to_dict.assert_not_called()
+
+    def test_log_error_with_context_debug(self):
+        """Test that context and traceback are logged at debug level."""
+        logger = create_autospec(logging.Logger, spec_set=True, instance=True)
+        logger.isEnabledFor.return_value = True
+        error = NotFoundError("Missing", context=ErrorContext(status_code=404))
+
+        log_error_with_context(logger, error, "test_operation")
+
+        assert logger.debug.call_count == 2
+
 
 class TestMigrationFunctions:
     """Test cases for migration utility functions."""
 
     def test_convert_github_exception_401(self):
         """Test converting 401 GitHub exception."""
-        exception = MagicMock()
-        exception.status = 401
-
-        result = convert_github_exception(exception, "test_operation")
+        result = convert_github_exception(GH_EXC_401, "test_operation")
 
         assert isinstance(result, AuthenticationError)
         assert result.context.status_code == 401
@@ -288,13 +422,8 @@ class TestErrorIntegration:
 
     def test_error_handling_workflow(self):
         """Test complete error handling workflow."""
-        # Simulate a GitHub API error
-        github_exception = MagicMock()
-        github_exception.status = 403
-        github_exception.__str__ = MagicMock(return_value="rate limit exceeded")
-
-        # Convert to custom exception
-        custom_error = convert_github_exception(github_exception, "get_repos")
+        # Convert a simulated GitHub API error to a custom exception
+        custom_error = convert_github_exception(GH_EXC_403_RL, "get_repos")
 
         # Format for display
         error_msg = format_error_message(custom_error)
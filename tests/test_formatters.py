@@ -0,0 +1,130 @@
+"""Tests for output formatters."""
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from rich.console import Console
+
+from github_repo_analyzer.core import Owner, Repository
+from github_repo_analyzer.formatters.json import display_json
+from github_repo_analyzer.formatters.summary import display_summary
+from github_repo_analyzer.formatters.table import _build_rows
+
+
+def _make_repo(name: str, **overrides) -> Repository:
+    """Build a Repository with sensible defaults for formatter tests."""
+    data = {
+        "name": name,
+        "full_name": f"user/{name}",
+        "html_url": f"https://github.com/user/{name}",
+        "clone_url": f"https://github.com/user/{name}.git",
+        "ssh_url": f"git@github.com:user/{name}.git",
+        "language": "Python",
+        "stargazers_count": 10,
+        "forks_count": 5,
+        "open_issues_count": 0,
+        "size": 2048,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-02T12:34:56Z",
+        "owner": Owner(
+            login="user",
+            id=12345,
+            type="User",
+            html_url="https://github.com/user",
+            avatar_url="https://avatars.githubusercontent.com/u/12345?v=4",
+        ),
+    }
+    data.update(overrides)
+    return Repository(**data)
+
+
+class TestTableRows:
+    """Test cases for table row formatting."""
+
+    def test_build_rows(self):
+        """Test that repository fields are formatted into table cells."""
+        rows = _build_rows([_make_repo("alpha", private=True)])
+
+        assert rows == [
+            ("alpha", "Python", "10", "5", "2.0", "✓", "✗", "2023-01-02"),
+        ]
+
+    def test_build_rows_missing_values(self):
+        """Test placeholders for missing language and update date."""
+        rows = _build_rows([_make_repo("beta", language=None, updated_at="")])
+
+        assert rows[0][1] == "N/A"
+        assert rows[0][7] == "N/A"
+
+
+class TestJsonOutput:
+    """Test cases for JSON output."""
+
+    def test_empty_list(self, capsys):
+        """Test that an empty list is rendered as an empty JSON array."""
+        display_json([])
+        assert capsys.readouterr().out == "[]\n"
+
+    def test_non_ascii_is_preserved(self, capsys):
+        """Test that non-ASCII descriptions are written without escaping."""
+        display_json([_make_repo("alpha", description="Café ☕")])
+
+        out = capsys.readouterr().out
+        assert "Café ☕" in out
+        assert json.loads(out)[0]["name"] == "alpha"
+
+    def test_stdlib_fallback(self, capsys):
+        """Test output when orjson is not available."""
+        with patch("github_repo_analyzer.formatters.json.orjson", None):
+            display_json([_make_repo("alpha", description="Café")])
+
+        out = capsys.readouterr().out
+        assert "Café" in out
+        assert json.loads(out)[0]["description"] == "Café"
+
+
+class TestSummary:
+    """Test cases for the summary panel."""
+
+    def _render(self, stats):
+        output = StringIO()
+        console = Console(file=output, width=100, color_system=None)
+        with patch("github_repo_analyzer.formatters.summary.console", console):
+            display_summary(stats, "testuser", False)
+        return output.getvalue()
+
+    def test_top_five_languages(self):
+        """Test that the first five presorted languages are listed in order."""
+        top_languages = [
+            ("Rust", 9),
+            ("Python", 7),
+            ("Java", 4),
+            ("Go", 3),
+            ("Ruby", 2),
+            ("C", 1),
+        ]
+        out = self._render({"total_repositories": 26, "top_languages": top_languages})
+
+        positions = [out.index(f"• {lang}:") for lang, _ in top_languages[:5]]
+        assert positions == sorted(positions)
+        assert "• C:" not in out
+
+    def test_statistics_keys(self):
+        """Test that the totals produced by get_repo_stats are displayed."""
+        stats = {
+            "total_repositories": 3,
+            "total_size_mb": 12.5,
+            "private_repositories": 2,
+            "archived_repositories": 1,
+        }
+        out = self._render(stats)
+
+        assert "Total Size: 12.5 MB" in out
+        assert "Private Repositories: 2" in out
+        assert "Archived Repositories: 1" in out
+
+    def test_no_languages(self):
+        """Test the placeholder shown without language data."""
+        out = self._render({"total_repositories": 0})
+        assert "No language data available" in out
@@ -0,0 +1,302 @@
+"""Tests for logging setup and helpers."""
+
+import logging
+import logging.handlers
+import os
+import time
+from datetime import date
+from unittest.mock import patch
+
+from github_repo_analyzer.loggers import setup as logger_setup
+from github_repo_analyzer.loggers.setup import (
+    ColoredFormatter,
+    FastRotatingFileHandler,
+    cleanup_old_logs,
+    get_default_log_dir,
+    get_default_log_file,
+    log_function_call,
+    setup_logging,
+)
+
+
+def _make_record(level: int = logging.INFO, msg: str = "hello") -> logging.LogRecord:
+    """Build a LogRecord for formatter tests."""
+    return logging.LogRecord("github_repo_analyzer", level, __file__, 1, msg, (), None)
+
+
+class TestDefaultLogPaths:
+    """Test cases for the default log locations."""
+
+    def setup_method(self):
+        """Clear cached paths so each test sees its own home directory."""
+        get_default_log_dir.cache_clear()
+        logger_setup._get_log_file_for_day.cache_clear()
+
+    teardown_method = setup_method
+
+    def test_log_dir_is_created_once(self, tmp_path):
+        """Test that the log directory is created and then cached."""
+        with patch(
+            "github_repo_analyzer.loggers.setup.Path.home", return_value=tmp_path
+        ):
+            first = get_default_log_dir()
+            second = get_default_log_dir()
+
+        assert first is second
+        assert first.is_dir()
+        assert get_default_log_dir.cache_info().hits == 1
+
+    def test_log_file_is_named_after_today(self, tmp_path):
+        """Test that the default log file uses today's date."""
+        with patch(
+            "github_repo_analyzer.loggers.setup.Path.home", return_value=tmp_path
+        ):
+            log_file = get_default_log_file()
+
+        expected = f"github-repo-analyzer-{date.today():%Y-%m-%d}.log"
+        assert log_file.endswith(expected)
+        assert log_file == get_default_log_file()
+
+
+class TestCleanupOldLogs:
+    """Test cases for cleanup_old_logs."""
+
+    def _write_logs(self, log_dir, count):
+        """Create dated log files with increasing modification times."""
+        for day in range(1, count + 1):
+            log_file = log_dir / f"github-repo-analyzer-2024-01-{day:02d}.log"
+            log_file.write_text("log", encoding="utf-8")
+            os.utime(log_file, (day * 1000, day * 1000))
+
+    def test_removes_oldest_logs(self, tmp_path):
+        """Test that only the newest max_files logs are kept."""
+        self._write_logs(tmp_path, 5)
+        (tmp_path / "other.log").write_text("keep", encoding="utf-8")
+
+        cleanup_old_logs(tmp_path, max_files=2)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "github-repo-analyzer-2024-01-04.log",
+            "github-repo-analyzer-2024-01-05.log",
+            "other.log",
+        ]
+
+    def test_under_limit_keeps_everything(self, tmp_path):
+        """Test that nothing is removed when within the limit."""
+        self._write_logs(tmp_path, 3)
+
+        cleanup_old_logs(tmp_path, max_files=3)
+
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_missing_directory_is_ignored(self, tmp_path):
+        """Test that cleanup errors are swallowed."""
+        cleanup_old_logs(tmp_path / "missing")
+
+
+class TestColoredFormatter:
+    """Test cases for ColoredFormatter."""
+
+    def test_colors_level_name_without_touching_record(self):
+        """Test that the level is colored without changing the record."""
+        formatter = ColoredFormatter(fmt="%(levelname)s | %(message)s")
+        formatter._colors_enabled = True
+        record = _make_record(logging.WARNING)
+
+        output = formatter.format(record)
+
+        assert output == "\033[33mWARNING\033[0m | hello"
+        assert record.levelname == "WARNING"
+
+    def test_color_wraps_padded_level_name(self):
+        """Test that width specifiers pad the level name inside the color."""
+        formatter = ColoredFormatter(fmt="%(levelname)-8s|%(message)s")
+        formatter._colors_enabled = True
+
+        assert formatter.format(_make_record()) == "\033[32mINFO    \033[0m|hello"
+
+    def test_colors_disabled(self):
+        """Test plain output when colors are not supported."""
+        formatter = ColoredFormatter(fmt="%(levelname)s | %(message)s")
+        formatter._colors_enabled = False
+
+        assert formatter.format(_make_record()) == "INFO | hello"
+
+    def test_unknown_level_is_not_colored(self):
+        """Test that custom level names are left untouched."""
+        formatter = ColoredFormatter(fmt="%(levelname)s")
+        formatter._colors_enabled = True
+        record = _make_record(15)
+
+        assert formatter.format(record) == "Level 15"
+
+    def test_colors_brace_style_level_name(self):
+        """Test that {-style formats are colored with the same style."""
+        formatter = ColoredFormatter(fmt="{levelname:<8}|{message}", style="{")
+        formatter._colors_enabled = True
+
+        assert formatter.format(_make_record()) == "\033[32mINFO    \033[0m|hello"
+
+    def test_colors_dollar_style_level_name(self):
+        """Test that $-style formats are colored with the same style."""
+        formatter = ColoredFormatter(fmt="${levelname} $message", style="$")
+        formatter._colors_enabled = True
+
+        assert formatter.format(_make_record()) == "\033[32mINFO\033[0m hello"
+
+    def test_colored_output_uses_converter(self):
+        """Test that a custom time converter is honored when coloring."""
+        formatter = ColoredFormatter(fmt="%(asctime)s %(levelname)s", datefmt="%H")
+        formatter.converter = lambda secs: time.gmtime((secs or 0) + 3600)
+        formatter._colors_enabled = True
+        record = _make_record()
+        record.created = 0
+
+        assert formatter.format(record) == "01 \033[32mINFO\033[0m"
+
+    def test_colored_output_uses_format_time_override(self):
+        """Test that subclasses overriding formatTime keep their timestamps."""
+
+        class FixedTimeFormatter(ColoredFormatter):
+            def formatTime(self, record, datefmt=None):
+                return "NOW"
+
+        formatter = FixedTimeFormatter(fmt="%(asctime)s %(levelname)s")
+        formatter._colors_enabled = True
+
+        assert formatter.format(_make_record()) == "NOW \033[32mINFO\033[0m"
+
+
+class TestFastRotatingFileHandler:
+    """Test cases for FastRotatingFileHandler."""
+
+    def test_skips_disk_check_far_from_limit(self, tmp_path):
+        """Test that the base rollover check is skipped for small files."""
+        handler = FastRotatingFileHandler(
+            str(tmp_path / "app.log"), maxBytes=10_000, backupCount=1
+        )
+        try:
+            with patch.object(
+                logging.handlers.RotatingFileHandler, "shouldRollover"
+            ) as base_check:
+                handler.handle(_make_record(msg="short message"))
+            base_check.assert_not_called()
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_size_limit(self, tmp_path):
+        """Test that files still rotate once the size limit is reached."""
+        log_file = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(str(log_file), maxBytes=1000, backupCount=1)
+        try:
+            for _ in range(50):
+                handler.handle(_make_record(msg="x" * 49))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").exists()
+        assert log_file.stat().st_size <= 1000
+
+    def test_byte_count_matches_file_inside_margin(self, tmp_path):
+        """Test that records near the limit are counted once, like the file."""
+        log_file = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(str(log_file), maxBytes=1000, backupCount=1)
+        try:
+            for _ in range(20):
+                handler.handle(_make_record(msg="x" * 40))
+            # Other callers of format() must not change the count either
+            handler.format(_make_record(msg="not written"))
+        finally:
+            handler.close()
+
+        assert not (tmp_path / "app.log.1").exists()
+        assert log_file.stat().st_size > 1000 - handler.ROLLOVER_MARGIN
+        assert handler._bytes_written == log_file.stat().st_size
+
+    def test_seeds_size_from_existing_file(self, tmp_path):
+        """Test that the byte count starts from the current file size."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("a" * 123, encoding="utf-8")
+
+        handler = FastRotatingFileHandler(str(log_file), maxBytes=1000, backupCount=1)
+        handler.close()
+
+        assert handler._bytes_written == 123
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def teardown_method(self):
+        """Stop the file listener and restore the package logger."""
+        logger_setup._stop_queue_listener()
+        logger = logging.getLogger("github_repo_analyzer")
+        logger.handlers.clear()
+        logger.propagate = True
+
+    def test_file_logging_goes_through_queue(self, tmp_path):
+        """Test that file records are queued and written by the listener."""
+        log_file = tmp_path / "app.log"
+        logger = setup_logging(log_file=str(log_file), quiet=True)
+
+        handler_types = {type(h) for h in logger.handlers}
+        assert logging.handlers.QueueHandler in handler_types
+        assert logging.handlers.RotatingFileHandler not in handler_types
+
+        logger.warning("written in the background")
+        logger_setup._stop_queue_listener()
+
+        assert "written in the background" in log_file.read_text(encoding="utf-8")
+
+    def test_repeated_setup_replaces_listener(self, tmp_path):
+        """Test that calling setup again stops the previous listener."""
+        setup_logging(log_file=str(tmp_path / "first.log"))
+        first = logger_setup._queue_listener
+        setup_logging(log_file=str(tmp_path / "second.log"))
+
+        assert first is not None
+        assert logger_setup._queue_listener is not first
+
+    def test_caller_fields_only_when_debugging(self, tmp_path):
+        """Test that the file format shows the call site only for debug logging."""
+        log_file = tmp_path / "app.log"
+        logger = setup_logging(log_file=str(log_file))
+        logger.info("no caller")
+        setup_logging(log_file=str(log_file), verbose=True)
+
+        logger.debug("with caller")
+        logger_setup._stop_queue_listener()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert "test_loggers.py" not in lines[0]
+        assert "test_caller_fields_only_when_debugging" in lines[-1]
+
+    def test_setup_leaves_global_record_fields_alone(self, tmp_path):
+        """Test that setup does not change process-wide LogRecord collection."""
+        srcfile = logging._srcfile
+        setup_logging(log_file=str(tmp_path / "app.log"))
+
+        assert logging._srcfile is srcfile
+        assert logging.logThreads and logging.logProcesses
+
+
+class TestLogFunctionCall:
+    """Test cases for log_function_call."""
+
+    def test_parameters_are_formatted_lazily(self, caplog):
+        """Test that parameters are rendered when the record is formatted."""
+        logger = logging.getLogger("tests.log_function_call")
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            log_function_call(logger, "analyze", username="octocat", limit=None)
+
+        record = caplog.records[0]
+        assert not isinstance(record.args[1], str)
+        assert record.getMessage() == "Calling analyze(username=octocat)"
+
+    def test_skipped_when_debug_disabled(self, caplog):
+        """Test that nothing is logged above DEBUG."""
+        logger = logging.getLogger("tests.log_function_call")
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_function_call(logger, "analyze", username="octocat")
+
+        assert caplog.records == []
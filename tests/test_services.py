@@ -0,0 +1,256 @@
+"""Tests for the repository service layer."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from github_repo_analyzer.core import Owner, Repository, RepositoryService
+
+
+def _make_repo(
+    name: str,
+    language: str = "Python",
+    stars: int = 0,
+    forks: int = 0,
+    private: bool = False,
+    size: int = 100,
+    updated_at: str = "2023-01-02T00:00:00Z",
+) -> Repository:
+    """Build a Repository with sensible defaults for service tests."""
+    return Repository(
+        name=name,
+        full_name=f"user/{name}",
+        html_url=f"https://github.com/user/{name}",
+        clone_url=f"https://github.com/user/{name}.git",
+        ssh_url=f"git@github.com:user/{name}.git",
+        language=language,
+        stargazers_count=stars,
+        forks_count=forks,
+        open_issues_count=0,
+        size=size,
+        created_at="2023-01-01T00:00:00Z",
+        updated_at=updated_at,
+        private=private,
+        owner=Owner(
+            login="user",
+            id=12345,
+            type="User",
+            html_url="https://github.com/user",
+            avatar_url="https://avatars.githubusercontent.com/u/12345?v=4",
+        ),
+    )
+
+
+class TestApplyFilters:
+    """Test cases for RepositoryService._apply_filters."""
+
+    def setup_method(self):
+        """Create a service and a small set of repositories."""
+        self.service = RepositoryService(Mock())
+        self.repos = [
+            _make_repo("alpha", language="Python", stars=50, forks=5),
+            _make_repo("beta", language="Go", stars=5, forks=1, private=True),
+            _make_repo("gamma", language="python", stars=500, forks=50),
+            _make_repo("delta", language=None, stars=10, forks=0),
+        ]
+
+    def test_no_filters_returns_input(self):
+        """Test that the input list is returned untouched without filters."""
+        assert self.service._apply_filters(self.repos) is self.repos
+
+    def test_language_filter_is_case_insensitive(self):
+        """Test filtering by language ignores case and skips missing languages."""
+        result = self.service._apply_filters(self.repos, language="PYTHON")
+        assert [r.name for r in result] == ["alpha", "gamma"]
+
+    def test_min_stars_and_forks(self):
+        """Test numeric thresholds are inclusive."""
+        result = self.service._apply_filters(self.repos, min_stars=10, min_forks=5)
+        assert [r.name for r in result] == ["alpha", "gamma"]
+
+    def test_visibility_filters(self):
+        """Test public-only and private-only filters."""
+        public = self.service._apply_filters(self.repos, public_only=True)
+        private = self.service._apply_filters(self.repos, private_only=True)
+        assert [r.name for r in public] == ["alpha", "gamma", "delta"]
+        assert [r.name for r in private] == ["beta"]
+
+    def test_combined_filters(self):
+        """Test that all filters are applied together."""
+        result = self.service._apply_filters(
+            self.repos, language="python", min_stars=100, public_only=True
+        )
+        assert [r.name for r in result] == ["gamma"]
+
+
+class TestSortRepositories:
+    """Test cases for RepositoryService._sort_repositories."""
+
+    def setup_method(self):
+        """Create a service and a small set of repositories."""
+        self.service = RepositoryService(Mock())
+        self.repos = [
+            _make_repo("beta", stars=5, forks=9, size=10, updated_at="2023-03-01"),
+            _make_repo("Alpha", stars=50, forks=1, size=30, updated_at="2023-01-01"),
+            _make_repo("gamma", stars=20, forks=4, size=20, updated_at="2023-02-01"),
+        ]
+
+    def _names(self, sort_field):
+        return [r.name for r in self.service._sort_repositories(self.repos, sort_field)]
+
+    def test_sort_by_name_is_case_insensitive(self):
+        """Test sorting by name ascending, ignoring case."""
+        assert self._names("name") == ["Alpha", "beta", "gamma"]
+
+    def test_sort_by_numeric_fields_descending(self):
+        """Test numeric sort fields order from highest to lowest."""
+        assert self._names("stars") == ["Alpha", "gamma", "beta"]
+        assert self._names("forks") == ["beta", "gamma", "Alpha"]
+        assert self._names("size") == ["Alpha", "gamma", "beta"]
+
+    def test_sort_by_updated_descending(self):
+        """Test sorting by most recently updated."""
+        assert self._names("updated") == ["beta", "gamma", "Alpha"]
+
+    def test_unknown_sort_field_keeps_order(self):
+        """Test that unknown sort fields leave the order unchanged."""
+        assert self._names("unknown") == ["beta", "Alpha", "gamma"]
+
+
+class TestSearchRepositories:
+    """Test cases for RepositoryService.search_repositories."""
+
+    def test_filters_use_search_api(self):
+        """Test that server-side representable filters use the Search API."""
+        api = Mock()
+        api.search_repos.return_value = [
+            _make_repo("public", stars=20),
+            _make_repo("secret", stars=30, private=True),
+        ]
+        service = RepositoryService(api)
+
+        result = service.search_repositories(
+            "testuser", language="Python", min_stars=10, public_only=True
+        )
+
+        assert [r.name for r in result] == ["public"]
+        api.search_repos.assert_called_once_with(
+            "testuser",
+            is_organization=False,
+            language="Python",
+            min_stars=10,
+            min_forks=None,
+            sort="updated",
+            limit=100,
+        )
+        api.get_repo_stats.assert_not_called()
+
+    def test_without_filters_lists_repositories(self):
+        """Test that unfiltered searches list repositories directly."""
+        api = Mock()
+        api.get_repo_stats.return_value = {
+            "repositories": [
+                _make_repo("public"),
+                _make_repo("secret", private=True),
+            ]
+        }
+        service = RepositoryService(api)
+
+        result = service.search_repositories("testuser", private_only=True)
+
+        assert [r.name for r in result] == ["secret"]
+        api.search_repos.assert_not_called()
+
+    def test_zero_thresholds_list_repositories(self):
+        """Test that zero star and fork thresholds do not trigger a search."""
+        api = Mock()
+        api.get_repo_stats.return_value = {"repositories": [_make_repo("alpha")]}
+        service = RepositoryService(api)
+
+        result = service.search_repositories("testuser", min_stars=0, min_forks=0)
+
+        assert [r.name for r in result] == ["alpha"]
+        api.search_repos.assert_not_called()
+
+    def test_limit_above_search_cap_filters_locally(self):
+        """Test that limits beyond the 1000-result search cap list and filter."""
+        api = Mock()
+        api.get_repo_stats.return_value = {
+            "repositories": [
+                _make_repo("alpha", language="Python", stars=50),
+                _make_repo("beta", language="Go", stars=50),
+                _make_repo("gamma", language="Python", stars=1),
+            ]
+        }
+        service = RepositoryService(api)
+
+        result = service.search_repositories(
+            "testuser", language="python", min_stars=10, limit=5000
+        )
+
+        assert [r.name for r in result] == ["alpha"]
+        api.search_repos.assert_not_called()
+        api.get_repo_stats.assert_called_once_with(
+            "testuser", is_organization=False, limit=5000
+        )
+
+
+class TestAnalyzeAsync:
+    """Test cases for the asynchronous analysis helpers."""
+
+    def test_analyze_repositories_async(self):
+        """Test that the async wrapper returns the synchronous result."""
+        api = Mock()
+        api.get_repo_stats.return_value = {"repositories": [_make_repo("alpha")]}
+        service = RepositoryService(api)
+
+        stats = asyncio.run(service.analyze_repositories_async("testuser"))
+
+        assert [r.name for r in stats["repositories"]] == ["alpha"]
+        api.get_repo_stats.assert_called_once_with(
+            "testuser", is_organization=False, limit=100
+        )
+
+    def test_analyze_many(self):
+        """Test that every target is analyzed and keyed by name."""
+        api = Mock()
+        api.get_repo_stats.side_effect = lambda target, **kwargs: {
+            "repositories": [_make_repo(f"{target}-repo")]
+        }
+        service = RepositoryService(api)
+
+        results = asyncio.run(
+            service.analyze_many(["alice", "bob"], limit=5, max_workers=2)
+        )
+
+        assert set(results) == {"alice", "bob"}
+        assert results["bob"]["repositories"][0].name == "bob-repo"
+        assert api.get_repo_stats.call_count == 2
+
+    def test_analyze_many_bounds_concurrency(self):
+        """Test that no more than max_workers API calls run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def _get_repo_stats(target, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return {"repositories": []}
+
+        api = Mock()
+        api.get_repo_stats.side_effect = _get_repo_stats
+        service = RepositoryService(api)
+
+        results = asyncio.run(
+            service.analyze_many([f"user{i}" for i in range(8)], max_workers=2)
+        )
+
+        assert len(results) == 8
+        assert peak <= 2
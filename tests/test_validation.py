@@ -1,8 +1,14 @@
 """Tests for the validation module."""
 
+import pickle
+from types import MappingProxyType
+
 import pytest
 
 from github_repo_analyzer.validation import (
+    AnalyzeInputs,
+    ConfigInputs,
+    SearchInputs,
     ValidationError,
     validate_analyze_inputs,
     validate_cache_dir,
@@ -19,6 +25,136 @@ from github_repo_analyzer.validation import (
     validate_username_or_org,
     validate_visibility_flags,
 )
+from github_repo_analyzer.validation.validation import _normalize_language
+
+# Boundary values, named once and shared by the tables and tests below
+MAX_USERNAME = "a" * 39
+LONG_USERNAME = "a" * 40
+LONG_LANGUAGE = "a" * 51
+LONG_CACHE_DIR = "a" * 501
+GHP_TOKEN = "ghp_" + "a" * 36
+GHO_TOKEN = "gho_" + "a" * 36
+CLASSIC_TOKEN = "a" * 40
+MIN_TOKEN = "a" * 20
+MAX_TOKEN = "a" * 200
+SHORT_TOKEN = "a" * 19
+LONG_TOKEN = "a" * 201
+
+VALID_USERNAMES = (
+    "user123",
+    "my-org",
+    "test_user",
+    pytest.param("a", id="min-length"),
+    pytest.param(MAX_USERNAME, id="max-length"),
+)
+INVALID_USERNAMES = (
+    pytest.param("user@name", id="special"),
+    pytest.param("user.name", id="dot"),
+    pytest.param("-username", id="leading-hyphen"),
+    pytest.param("username-", id="trailing-hyphen"),
+    pytest.param("user--name", id="consecutive-hyphens"),
+    pytest.param("üser", id="non-ascii"),
+    pytest.param("user name", id="space"),
+)
+USERNAME_ERROR_MESSAGES = (
+    pytest.param(LONG_USERNAME, "cannot exceed 39 characters", id="too-long"),
+    pytest.param("user@name", "can only contain alphanumeric", id="special"),
+    pytest.param("username-", "cannot start or end with hyphens", id="hyphen-end"),
+    pytest.param("user--name", "cannot have consecutive hyphens", id="double-hyphen"),
+)
+VALID_LIMITS = (None, -1, 0, 1, 100, 1000)
+INVALID_LIMITS = (-2, -10, -100)
+VALID_VISIBILITY_FLAGS = ((False, False), (True, False), (False, True))
+# (input, normalized) pairs; names are stripped and title-cased
+LANGUAGE_CASES = (
+    ("Python", "Python"),
+    ("JavaScript", "Javascript"),
+    ("C++", "C++"),
+    ("C#", "C#"),
+    ("Go", "Go"),
+    ("Rust", "Rust"),
+    ("TypeScript", "Typescript"),
+    ("HTML/CSS", "Html/Css"),
+    ("Shell", "Shell"),
+    ("  rust  ", "Rust"),
+)
+BLANK_LANGUAGES = (None, "", "   ")
+INVALID_LANGUAGES = (
+    pytest.param("Python@", id="at-sign"),
+    pytest.param("JavaScript!", id="exclamation"),
+    pytest.param("C++$", id="dollar"),
+    pytest.param("Pythön", id="non-ascii"),
+)
+VALID_MIN_STARS = (None, 0, 1, 10, 100, 1000, 1000000)
+INVALID_MIN_STARS = (-1, -10, 1000001)
+VALID_MIN_FORKS = (None, 0, 1, 10, 100, 1000, 100000)
+INVALID_MIN_FORKS = (-1, -10, 100001)
+VALID_SORT_FIELDS = ("name", "stars", "forks", "updated", "created", "size")
+VALID_OUTPUT_FORMATS = ("table", "json", "summary")
+VALID_CACHE_TTLS = (0, 1, 3600, 86400, 86400 * 30)  # Up to 30 days
+INVALID_CACHE_TTLS = (-1, -10, 86400 * 31)  # Negative or over 30 days
+VALID_CACHE_DIRS = (".cache", "/tmp/cache", "~/cache", "cache")
+INVALID_CACHE_DIRS = (
+    pytest.param("", id="empty"),
+    pytest.param("   ", id="whitespace"),
+    pytest.param(LONG_CACHE_DIR, id="too-long"),
+)
+VALID_TOKENS = (
+    pytest.param(GHP_TOKEN, id="fine-grained"),
+    pytest.param(GHO_TOKEN, id="oauth"),
+    pytest.param(CLASSIC_TOKEN, id="classic"),
+    pytest.param(MIN_TOKEN, id="min-length"),
+    pytest.param(MAX_TOKEN, id="max-length"),
+)
+INVALID_TOKENS = (
+    pytest.param("", id="empty"),
+    pytest.param("   ", id="whitespace"),
+    pytest.param(SHORT_TOKEN, id="too-short"),
+    pytest.param(LONG_TOKEN, id="too-long"),
+)
+
+# The numeric validators share one range check, so one table covers them all
+NUMERIC_CASES = (
+    (validate_limit, "limit", VALID_LIMITS, INVALID_LIMITS),
+    (validate_min_stars, "min_stars", VALID_MIN_STARS, INVALID_MIN_STARS),
+    (validate_min_forks, "min_forks", VALID_MIN_FORKS, INVALID_MIN_FORKS),
+    (validate_cache_ttl, "cache_ttl", VALID_CACHE_TTLS, INVALID_CACHE_TTLS),
+)
+VALID_NUMBERS = tuple(
+    pytest.param(validator, value, id=f"{field}={value}")
+    for validator, field, valid, _ in NUMERIC_CASES
+    for value in valid
+)
+INVALID_NUMBERS = tuple(
+    pytest.param(validator, value, field, id=f"{field}={value}")
+    for validator, field, _, invalid in NUMERIC_CASES
+    for value in invalid
+)
+
+# Read-only keyword sets for the aggregate validators
+VALID_ANALYZE_INPUTS = MappingProxyType(
+    {
+        "username_or_org": "testuser",
+        "limit": 100,
+        "sort_field": "stars",
+        "output_format": "table",
+    }
+)
+VALID_SEARCH_INPUTS = MappingProxyType(
+    {
+        "username_or_org": "testuser",
+        "limit": 50,
+        "sort_field": "forks",
+        "language": "Python",
+        "min_stars": 10,
+        "min_forks": 5,
+        "public_only": True,
+        "private_only": False,
+    }
+)
+VALID_CONFIG_INPUTS = MappingProxyType(
+    {"token": GHP_TOKEN, "cache_dir": ".cache", "cache_ttl": 3600}
+)
 
 
 class TestValidationError:
@@ -36,23 +172,20 @@ class TestValidationError:
         assert str(error) == "Test error"
         assert error.field is None
 
+    def test_validation_error_pickle_keeps_field(self):
+        """Test that the slotted field survives pickling."""
+        error = pickle.loads(pickle.dumps(ValidationError("Test error", "limit")))
+        assert str(error) == "Test error"
+        assert error.field == "limit"
+
 
 class TestValidateUsernameOrOrg:
     """Test cases for validate_username_or_org function."""
 
-    def test_valid_usernames(self):
+    @pytest.mark.parametrize("name", VALID_USERNAMES)
+    def test_valid_usernames(self, name):
         """Test valid usernames."""
-        valid_names = [
-            "user123",
-            "my-org",
-            "test_user",
-            "a",  # Minimum length
-            "a" * 39,  # Maximum length
-        ]
-
-        for name in valid_names:
-            result = validate_username_or_org(name)
-            assert result == name.strip()
+        assert validate_username_or_org(name) == name
 
     def test_empty_username(self):
         """Test empty username."""
@@ -68,51 +201,56 @@ class TestValidateUsernameOrOrg:
 
     def test_username_too_long(self):
         """Test username exceeding 39 characters."""
-        long_name = "a" * 40
         with pytest.raises(ValidationError) as exc_info:
-            validate_username_or_org(long_name)
+            validate_username_or_org(LONG_USERNAME)
         assert exc_info.value.field == "username_or_org"
 
-    def test_username_invalid_characters(self):
+    @pytest.mark.parametrize("name", INVALID_USERNAMES)
+    def test_username_invalid_characters(self, name):
         """Test usernames with invalid characters."""
-        invalid_names = [
-            "user@name",  # Special characters
-            "user.name",  # Dots
-            "-username",  # Starts with hyphen
-            "username-",  # Ends with hyphen
-            "user--name",  # Consecutive hyphens
-        ]
-
-        for name in invalid_names:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_username_or_org(name)
-            assert exc_info.value.field == "username_or_org"
+        with pytest.raises(ValidationError) as exc_info:
+            validate_username_or_org(name)
+        assert exc_info.value.field == "username_or_org"
+
+    @pytest.mark.parametrize("name,message", USERNAME_ERROR_MESSAGES)
+    def test_username_error_messages(self, name, message):
+        """Test that each broken rule reports its own message."""
+        with pytest.raises(ValidationError, match=message):
+            validate_username_or_org(name)
 
     def test_username_strips_whitespace(self):
         """Test that usernames are stripped of whitespace."""
         result = validate_username_or_org("  testuser  ")
         assert result == "testuser"
 
+    def test_repeated_usernames_are_cached(self):
+        """Test that valid names are cached and invalid ones are not."""
+        validate_username_or_org.cache_clear()
 
-class TestValidateLimit:
-    """Test cases for validate_limit function."""
+        assert validate_username_or_org("octocat") == "octocat"
+        assert validate_username_or_org("octocat") == "octocat"
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_username_or_org("-octocat")
 
-    def test_valid_limits(self):
-        """Test valid limit values."""
-        valid_limits = [None, -1, 0, 1, 100, 1000]
+        info = validate_username_or_org.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
 
-        for limit in valid_limits:
-            result = validate_limit(limit)
-            assert result == limit
 
-    def test_invalid_limits(self):
-        """Test invalid limit values."""
-        invalid_limits = [-2, -10, -100]
+class TestNumericValidators:
+    """Test cases for the limit, min_stars, min_forks and cache_ttl validators."""
 
-        for limit in invalid_limits:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_limit(limit)
-            assert exc_info.value.field == "limit"
+    @pytest.mark.parametrize("validator,value", VALID_NUMBERS)
+    def test_valid_values(self, validator, value):
+        """Test that in-range values pass through unchanged."""
+        assert validator(value) == value
+
+    @pytest.mark.parametrize("validator,value,field", INVALID_NUMBERS)
+    def test_invalid_values(self, validator, value, field):
+        """Test that out-of-range values report the validated field."""
+        with pytest.raises(ValidationError) as exc_info:
+            validator(value)
+        assert exc_info.value.field == field
 
     def test_custom_field_name(self):
         """Test custom field name in error message."""
@@ -124,17 +262,11 @@ class TestValidateLimit:
 class TestValidateVisibilityFlags:
     """Test cases for validate_visibility_flags function."""
 
-    def test_valid_combinations(self):
+    @pytest.mark.parametrize("public_only,private_only", VALID_VISIBILITY_FLAGS)
+    def test_valid_combinations(self, public_only, private_only):
         """Test valid flag combinations."""
-        valid_combinations = [
-            (False, False),
-            (True, False),
-            (False, True),
-        ]
-
-        for public_only, private_only in valid_combinations:
-            # Should not raise
-            validate_visibility_flags(public_only, private_only)
+        # Should not raise
+        validate_visibility_flags(public_only, private_only)
 
     def test_invalid_combination(self):
         """Test invalid flag combination."""
@@ -146,91 +278,36 @@ class TestValidateVisibilityFlags:
 class TestValidateLanguage:
     """Test cases for validate_language function."""
 
-    def test_valid_languages(self):
+    @pytest.mark.parametrize("lang,expected", LANGUAGE_CASES)
+    def test_valid_languages(self, lang, expected):
         """Test valid programming languages."""
-        valid_languages = [
-            "Python",
-            "JavaScript",
-            "C++",
-            "C#",
-            "Go",
-            "Rust",
-            "TypeScript",
-            "HTML/CSS",
-            "Shell",
-            None,
-            "",
-            "   ",  # Whitespace only
-        ]
-
-        for lang in valid_languages:
-            result = validate_language(lang)
-            if lang and lang.strip():
-                assert result == lang.strip().title()
-            else:
-                assert result is None
+        assert validate_language(lang) == expected
+
+    @pytest.mark.parametrize("lang", BLANK_LANGUAGES)
+    def test_blank_languages(self, lang):
+        """Test that missing or whitespace-only languages mean no filter."""
+        assert validate_language(lang) is None
+
+    def test_repeated_languages_are_cached(self):
+        """Test that normalizing the same language twice hits the cache."""
+        _normalize_language.cache_clear()
+
+        assert validate_language("rust") == "Rust"
+        assert validate_language("rust") == "Rust"
+        assert _normalize_language.cache_info().hits == 1
 
     def test_language_too_long(self):
         """Test language name exceeding 50 characters."""
-        long_lang = "a" * 51
         with pytest.raises(ValidationError) as exc_info:
-            validate_language(long_lang)
+            validate_language(LONG_LANGUAGE)
         assert exc_info.value.field == "language"
 
-    def test_language_invalid_characters(self):
+    @pytest.mark.parametrize("lang", INVALID_LANGUAGES)
+    def test_language_invalid_characters(self, lang):
         """Test language names with invalid characters."""
-        invalid_languages = [
-            "Python@",
-            "JavaScript!",
-            "C++$",
-        ]
-
-        for lang in invalid_languages:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_language(lang)
-            assert exc_info.value.field == "language"
-
-
-class TestValidateMinStars:
-    """Test cases for validate_min_stars function."""
-
-    def test_valid_min_stars(self):
-        """Test valid minimum stars values."""
-        valid_values = [None, 0, 1, 10, 100, 1000, 1000000]
-
-        for value in valid_values:
-            result = validate_min_stars(value)
-            assert result == value
-
-    def test_invalid_min_stars(self):
-        """Test invalid minimum stars values."""
-        invalid_values = [-1, -10, 1000001]
-
-        for value in invalid_values:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_min_stars(value)
-            assert exc_info.value.field == "min_stars"
-
-
-class TestValidateMinForks:
-    """Test cases for validate_min_forks function."""
-
-    def test_valid_min_forks(self):
-        """Test valid minimum forks values."""
-        valid_values = [None, 0, 1, 10, 100, 1000, 100000]
-
-        for value in valid_values:
-            result = validate_min_forks(value)
-            assert result == value
-
-    def test_invalid_min_forks(self):
-        """Test invalid minimum forks values."""
-        invalid_values = [-1, -10, 100001]
-
-        for value in invalid_values:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_min_forks(value)
-            assert exc_info.value.field == "min_forks"
+        with pytest.raises(ValidationError) as exc_info:
+            validate_language(lang)
+        assert exc_info.value.field == "language"
 
 
 class TestValidateSortField:
@@ -238,11 +315,7 @@ class TestValidateSortField:
 
     def test_valid_sort_fields(self):
         """Test valid sort fields."""
-        valid_fields = ["name", "stars", "forks", "updated", "created", "size"]
-
-        for field in valid_fields:
-            result = validate_sort_field(field)
-            assert result == field
+        assert tuple(map(validate_sort_field, VALID_SORT_FIELDS)) == VALID_SORT_FIELDS
 
     def test_invalid_sort_field(self):
         """Test invalid sort field."""
@@ -256,11 +329,8 @@ class TestValidateOutputFormat:
 
     def test_valid_output_formats(self):
         """Test valid output formats."""
-        valid_formats = ["table", "json", "summary"]
-
-        for format_type in valid_formats:
-            result = validate_output_format(format_type)
-            assert result == format_type
+        formats = tuple(map(validate_output_format, VALID_OUTPUT_FORMATS))
+        assert formats == VALID_OUTPUT_FORMATS
 
     def test_invalid_output_format(self):
         """Test invalid output format."""
@@ -269,73 +339,36 @@ class TestValidateOutputFormat:
         assert exc_info.value.field == "output_format"
 
 
-class TestValidateCacheTtl:
-    """Test cases for validate_cache_ttl function."""
-
-    def test_valid_cache_ttl(self):
-        """Test valid cache TTL values."""
-        valid_values = [0, 1, 3600, 86400, 86400 * 30]  # Up to 30 days
-
-        for value in valid_values:
-            result = validate_cache_ttl(value)
-            assert result == value
-
-    def test_invalid_cache_ttl(self):
-        """Test invalid cache TTL values."""
-        invalid_values = [-1, -10, 86400 * 31]  # Negative or over 30 days
-
-        for value in invalid_values:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_cache_ttl(value)
-            assert exc_info.value.field == "cache_ttl"
-
-
 class TestValidateCacheDir:
     """Test cases for validate_cache_dir function."""
 
-    def test_valid_cache_dirs(self):
+    @pytest.mark.parametrize("cache_dir", VALID_CACHE_DIRS)
+    def test_valid_cache_dirs(self, cache_dir):
         """Test valid cache directories."""
-        valid_dirs = [".cache", "/tmp/cache", "~/cache", "cache"]
+        assert validate_cache_dir(cache_dir) == cache_dir
 
-        for cache_dir in valid_dirs:
-            result = validate_cache_dir(cache_dir)
-            assert result == cache_dir.strip()
-
-    def test_invalid_cache_dirs(self):
+    @pytest.mark.parametrize("cache_dir", INVALID_CACHE_DIRS)
+    def test_invalid_cache_dirs(self, cache_dir):
         """Test invalid cache directories."""
-        invalid_dirs = ["", "   ", "a" * 501]  # Empty or too long
-
-        for cache_dir in invalid_dirs:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_cache_dir(cache_dir)
-            assert exc_info.value.field == "cache_dir"
+        with pytest.raises(ValidationError) as exc_info:
+            validate_cache_dir(cache_dir)
+        assert exc_info.value.field == "cache_dir"
 
 
 class TestValidateGithubToken:
     """Test cases for validate_github_token function."""
 
-    def test_valid_tokens(self):
+    @pytest.mark.parametrize("token", VALID_TOKENS)
+    def test_valid_tokens(self, token):
         """Test valid GitHub tokens."""
-        valid_tokens = [
-            "ghp_" + "a" * 36,  # Fine-grained token
-            "gho_" + "a" * 36,  # OAuth token
-            "a" * 40,  # Classic token
-            "a" * 20,  # Minimum length
-            "a" * 200,  # Maximum length
-        ]
-
-        for token in valid_tokens:
-            result = validate_github_token(token)
-            assert result == token.strip()
-
-    def test_invalid_tokens(self):
-        """Test invalid GitHub tokens."""
-        invalid_tokens = ["", "   ", "a" * 19, "a" * 201]  # Too short or too long
+        assert validate_github_token(token) == token
 
-        for token in invalid_tokens:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_github_token(token)
-            assert exc_info.value.field == "github_token"
+    @pytest.mark.parametrize("token", INVALID_TOKENS)
+    def test_invalid_tokens(self, token):
+        """Test invalid GitHub tokens."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_github_token(token)
+        assert exc_info.value.field == "github_token"
 
 
 class TestValidateAnalyzeInputs:
@@ -343,18 +376,8 @@ class TestValidateAnalyzeInputs:
 
     def test_valid_analyze_inputs(self):
         """Test valid analyze inputs."""
-        inputs = {
-            "username_or_org": "testuser",
-            "limit": 100,
-            "sort_field": "stars",
-            "output_format": "table",
-        }
-
-        result = validate_analyze_inputs(**inputs)
-        assert result["username_or_org"] == "testuser"
-        assert result["limit"] == 100
-        assert result["sort_field"] == "stars"
-        assert result["output_format"] == "table"
+        result = validate_analyze_inputs(**VALID_ANALYZE_INPUTS)
+        assert result == AnalyzeInputs(**VALID_ANALYZE_INPUTS)
 
     def test_invalid_analyze_inputs(self):
         """Test invalid analyze inputs."""
@@ -367,22 +390,8 @@ class TestValidateSearchInputs:
 
     def test_valid_search_inputs(self):
         """Test valid search inputs."""
-        inputs = {
-            "username_or_org": "testuser",
-            "limit": 50,
-            "sort_field": "forks",
-            "language": "Python",
-            "min_stars": 10,
-            "min_forks": 5,
-            "public_only": True,
-            "private_only": False,
-        }
-
-        result = validate_search_inputs(**inputs)
-        assert result["username_or_org"] == "testuser"
-        assert result["language"] == "Python"
-        assert result["min_stars"] == 10
-        assert result["public_only"] is True
+        result = validate_search_inputs(**VALID_SEARCH_INPUTS)
+        assert result == SearchInputs(**VALID_SEARCH_INPUTS)
 
     def test_invalid_search_inputs(self):
         """Test invalid search inputs."""
@@ -397,28 +406,13 @@ class TestValidateConfigInputs:
 
     def test_valid_config_inputs(self):
         """Test valid config inputs."""
-        inputs = {
-            "token": "ghp_" + "a" * 36,
-            "cache_dir": ".cache",
-            "cache_ttl": 3600,
-        }
-
-        result = validate_config_inputs(**inputs)
-        assert result["token"] == inputs["token"]
-        assert result["cache_dir"] == ".cache"
-        assert result["cache_ttl"] == 3600
+        result = validate_config_inputs(**VALID_CONFIG_INPUTS)
+        assert result == ConfigInputs(**VALID_CONFIG_INPUTS)
 
     def test_config_inputs_without_token(self):
         """Test config inputs without token."""
-        inputs = {
-            "cache_dir": ".cache",
-            "cache_ttl": 3600,
-        }
-
-        result = validate_config_inputs(**inputs)
-        assert "token" not in result
-        assert result["cache_dir"] == ".cache"
-        assert result["cache_ttl"] == 3600
+        result = validate_config_inputs(cache_dir=".cache", cache_ttl=3600)
+        assert result == ConfigInputs(cache_dir=".cache", cache_ttl=3600, token=None)
 
     def test_invalid_config_inputs(self):
         """Test invalid config inputs."""